@@ -43,6 +43,7 @@ class Settings:
     google_cse_id: Optional[str] = os.getenv("GOOGLE_CSE_ID") or None
 
     request_timeout_s: float = float(os.getenv("HARVESTER_REQUEST_TIMEOUT_S", "20"))
+    extract_cache_size: int = int(os.getenv("HARVESTER_EXTRACT_CACHE_SIZE", "4096"))
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "cors_origins", _csv_env("HARVESTER_API_CORS_ORIGINS", "*"))
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
+import soupsieve
 from bs4 import BeautifulSoup
 
+from app.config import settings
+
 
 KEYWORDS_EN = ["ingredients", "inci"]
 KEYWORDS_ZH = ["全成分", "成分", "配料", "配方"]
@@ -68,7 +74,39 @@ INCI_SIGNAL_RE = re.compile(
 )
 
 
-@dataclass(frozen=True)
+# Compiled once at import: extraction runs per fetched page and these patterns never change.
+_WS_RE = re.compile(r"\s+")
+_ZERO_WIDTH_RE = re.compile(r"[\u200b\u200c\u200d\ufeff]")
+_URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+_HASHTAG_RE = re.compile(r"(^|\s)#[\w-]+")
+_UI_ARTIFACT_RES = tuple(re.compile(pat, re.IGNORECASE) for pat in UI_ARTIFACT_PATTERNS)
+_MORE_BRACKET_RE = re.compile(r"\[\s*more\s*\]", re.IGNORECASE)
+_ELLIPSIS_RE = re.compile(r"(\.{3,}|…)")
+_TRAILING_AND_RE = re.compile(r"\b(and|&)\s*$", re.IGNORECASE)
+_TRAILING_ETC_RE = re.compile(r"\betc\.?\s*$", re.IGNORECASE)
+_DISCLAIMER_RES = tuple(re.compile(pat, re.IGNORECASE) for pat in DISCLAIMER_PATTERNS)
+_LABEL_PREFIX_EN_RE = re.compile(r"^(ingredients?|inci)\s*[:：]\s*", re.IGNORECASE)
+_LABEL_PREFIX_ZH_RE = re.compile(r"^(全成分|成分|配料|配方)\s*[:：]\s*")
+_LABEL_EN_RE = re.compile(r"(ingredients?|inci)\s*[:：]\s*", re.IGNORECASE)
+_LABEL_ZH_RE = re.compile(r"(全成分|成分|配料|配方)\s*[:：]\s*")
+_LEADING_INGREDIENTS_RE = re.compile(r"^ingredients?\s+", re.IGNORECASE)
+_COMMON_TOKEN_RES = tuple(re.compile(rf"\b{re.escape(token)}\b", re.IGNORECASE) for token in COMMON_TOKENS)
+_INGREDIENT_SEQUENCE_RE = re.compile(
+    r"([A-Za-z0-9][A-Za-z0-9()/&+.'’ -]*(?:,\s*[A-Za-z0-9][A-Za-z0-9()/&+.'’ -]*){4,})"
+)
+_SCRIPT_OR_JSON_RE = re.compile("|".join(SCRIPT_OR_JSON_PATTERNS), re.IGNORECASE)
+_LIST_SPLIT_RE = re.compile(r"[,;，；]\s*")
+_INGREDIENTS_WORD_RE = re.compile(r"\bingredients?\b")
+_INCI_WORD_RE = re.compile(r"\binci\b")
+_PACK_SIZE_HINT_RE = re.compile(r"\b(oz|ml|patches?|refill|kit|set|duo|trio|collection)\b", re.IGNORECASE)
+_DIGIT_RE = re.compile(r"\d")
+_LABEL_WORD_RE = re.compile(r"(ingredients?|inci)", re.IGNORECASE)
+
+_POPUP_SELECTOR = soupsieve.compile(".ingredients-popup, [class*='ingredients-popup']")
+_INGREDIENT_BLOCK_SELECTOR = soupsieve.compile("[id*='ingredient'],[class*='ingredient'],[data-testid*='ingredient']")
+
+
+@dataclass(frozen=True, slots=True)
 class ExtractedIngredients:
     text: str
     score: float
@@ -77,7 +115,7 @@ class ExtractedIngredients:
 
 
 def _normalize_space(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return _WS_RE.sub(" ", (s or "").strip())
 
 
 def clean_noise(text: str) -> str:
@@ -86,34 +124,34 @@ def clean_noise(text: str) -> str:
         return ""
 
     # Zero-width / BOM characters.
-    t = re.sub(r"[\u200b\u200c\u200d\ufeff]", "", t)
+    t = _ZERO_WIDTH_RE.sub("", t)
 
     # Strip URLs.
-    t = re.sub(r"https?://\S+", " ", t, flags=re.IGNORECASE)
+    t = _URL_RE.sub(" ", t)
 
     # Remove hashtag-style marketing tags.
-    t = re.sub(r"(^|\s)#[\w-]+", " ", t)
+    t = _HASHTAG_RE.sub(" ", t)
 
     # Common UI artifacts and truncation markers.
-    for pat in UI_ARTIFACT_PATTERNS:
-        t = re.sub(pat, " ", t, flags=re.IGNORECASE)
-    t = re.sub(r"\[\s*more\s*\]", " ", t, flags=re.IGNORECASE)
-    t = re.sub(r"(\.{3,}|…)", " ", t)
+    for pat in _UI_ARTIFACT_RES:
+        t = pat.sub(" ", t)
+    t = _MORE_BRACKET_RE.sub(" ", t)
+    t = _ELLIPSIS_RE.sub(" ", t)
 
     # Remove trailing truncation.
-    t = re.sub(r"\b(and|&)\s*$", " ", t, flags=re.IGNORECASE)
-    t = re.sub(r"\betc\.?\s*$", " ", t, flags=re.IGNORECASE)
+    t = _TRAILING_AND_RE.sub(" ", t)
+    t = _TRAILING_ETC_RE.sub(" ", t)
 
-    for pat in DISCLAIMER_PATTERNS:
-        t = re.sub(pat, " ", t, flags=re.IGNORECASE)
+    for pat in _DISCLAIMER_RES:
+        t = pat.sub(" ", t)
 
     return _normalize_space(t)
 
 
 def _strip_label_prefix(s: str) -> str:
     t = (s or "").strip()
-    t = re.sub(r"^(ingredients?|inci)\s*[:：]\s*", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"^(全成分|成分|配料|配方)\s*[:：]\s*", "", t)
+    t = _LABEL_PREFIX_EN_RE.sub("", t)
+    t = _LABEL_PREFIX_ZH_RE.sub("", t)
     return t.strip()
 
 
@@ -121,10 +159,10 @@ def _slice_after_label(s: str) -> str:
     t = (s or "").strip()
     if not t:
         return ""
-    m = re.search(r"(ingredients?|inci)\s*[:：]\s*", t, flags=re.IGNORECASE)
+    m = _LABEL_EN_RE.search(t)
     if m and m.start() > 0:
         return t[m.end() :].strip()
-    m = re.search(r"(全成分|成分|配料|配方)\s*[:：]\s*", t)
+    m = _LABEL_ZH_RE.search(t)
     if m and m.start() > 0:
         return t[m.end() :].strip()
     return t
@@ -135,11 +173,11 @@ def _extract_inline_ingredient_sequence(text: str) -> str:
     if not t:
         return ""
 
-    t = re.sub(r"^ingredients?\s+", "", t, flags=re.IGNORECASE)
+    t = _LEADING_INGREDIENTS_RE.sub("", t)
 
     start_positions: list[int] = []
-    for token in COMMON_TOKENS:
-        match = re.search(rf"\b{re.escape(token)}\b", t, flags=re.IGNORECASE)
+    for token_re in _COMMON_TOKEN_RES:
+        match = token_re.search(t)
         if not match:
             continue
         prefix = t[: match.start()]
@@ -153,10 +191,7 @@ def _extract_inline_ingredient_sequence(text: str) -> str:
 
     # Capture dense comma-separated sequences, which commonly start after a short
     # explanatory phrase on official PDP accordions.
-    sequence = re.search(
-        r"([A-Za-z0-9][A-Za-z0-9()/&+.'’ -]*(?:,\s*[A-Za-z0-9][A-Za-z0-9()/&+.'’ -]*){4,})",
-        t,
-    )
+    sequence = _INGREDIENT_SEQUENCE_RE.search(t)
     if not sequence:
         return t
     return _normalize_space(sequence.group(1))
@@ -171,16 +206,26 @@ def _dom_text(soup: BeautifulSoup) -> str:
     return _normalize_space(soup.get_text(" ", strip=True))
 
 
+def _token_in_dom_text(dom_lower: str, extracted_text: str) -> bool:
+    token = _normalize_space(_strip_label_prefix(clean_noise(extracted_text)))[:20].lower()
+    if not token:
+        return False
+    return token in dom_lower
+
+
 def verify_token_in_dom(html: str, extracted_text: str) -> bool:
     if not html or not extracted_text:
         return False
     soup = BeautifulSoup(html, "lxml")
     _strip_non_content_tags(soup)
-    dom = _dom_text(soup).lower()
-    token = _normalize_space(_strip_label_prefix(clean_noise(extracted_text)))[:20].lower()
-    if not token:
+    return _token_in_dom_text(_dom_text(soup).lower(), extracted_text)
+
+
+def _verify_in_soup(soup: BeautifulSoup, extracted_text: str) -> bool:
+    # Extraction only reads the already-stripped soup, so its text matches a fresh parse of the same HTML.
+    if not extracted_text:
         return False
-    return token in dom
+    return _token_in_dom_text(_dom_text(soup).lower(), extracted_text)
 
 
 def _looks_like_script_or_json(text: str) -> bool:
@@ -189,7 +234,7 @@ def _looks_like_script_or_json(text: str) -> bool:
         return False
     if len(t) >= 120 and t.lstrip().startswith(("{", "[")):
         return True
-    if re.search("|".join(SCRIPT_OR_JSON_PATTERNS), t, flags=re.IGNORECASE):
+    if _SCRIPT_OR_JSON_RE.search(t):
         return True
     if t.count("{") >= 3 and t.count("}") >= 3 and t.count(":") >= 4 and t.count('"') >= 4:
         return True
@@ -213,7 +258,7 @@ def _feature_score(text: str) -> float:
     hits = sum(1 for tok in COMMON_TOKENS if tok in lower)
     score += min(0.35, hits * 0.08)
     # Token-ish density.
-    parts = re.split(r"[,;，；]\s*", t)
+    parts = _LIST_SPLIT_RE.split(t)
     token_count = len([p for p in parts if p.strip()])
     if token_count >= 5:
         score += 0.3
@@ -239,10 +284,10 @@ def _looks_like_heading(text: str, keywords: list[str]) -> bool:
     for k in keywords:
         kk = k.lower()
         if kk == "ingredients":
-            if re.search(r"\bingredients?\b", lower):
+            if _INGREDIENTS_WORD_RE.search(lower):
                 return True
         elif kk == "inci":
-            if re.search(r"\binci\b", lower):
+            if _INCI_WORD_RE.search(lower):
                 return True
         else:
             if kk in lower:
@@ -257,9 +302,9 @@ def _variant_hint(product_name: str) -> str:
     hint = raw.rsplit(" - ", 1)[-1].strip()
     if not hint:
         return ""
-    if re.search(r"\b(oz|ml|patches?|refill|kit|set|duo|trio|collection)\b", hint, flags=re.IGNORECASE):
+    if _PACK_SIZE_HINT_RE.search(hint):
         return ""
-    if re.search(r"\d", hint):
+    if _DIGIT_RE.search(hint):
         return ""
     return hint
 
@@ -270,7 +315,7 @@ def _popup_variant_labels(popup: BeautifulSoup) -> list[str]:
         txt = _normalize_space(el.get_text(" ", strip=True))
         if not txt or len(txt) <= 3:
             continue
-        parts = re.split(r"\s+", txt, maxsplit=1)
+        parts = _WS_RE.split(txt, maxsplit=1)
         if not parts:
             continue
         label = parts[0].strip(" :-:\u00a0")
@@ -278,7 +323,7 @@ def _popup_variant_labels(popup: BeautifulSoup) -> list[str]:
             continue
         if "," in label or "/" in label:
             continue
-        if re.search(r"(ingredients?|inci)", label, flags=re.IGNORECASE):
+        if _LABEL_WORD_RE.search(label):
             continue
         labels.append(label)
     return list(dict.fromkeys(labels))
@@ -301,7 +346,7 @@ def _collect_popup_candidates(soup: BeautifulSoup, product_name: str) -> list[st
     fallback: list[str] = []
     hint = _variant_hint(product_name).lower()
 
-    for popup in soup.select(".ingredients-popup, [class*='ingredients-popup']"):
+    for popup in _POPUP_SELECTOR.select(soup):
         paragraphs = popup.find_all(["p", "li"])
         if not paragraphs:
             txt = _normalize_space(popup.get_text(" ", strip=True))
@@ -323,20 +368,20 @@ def _collect_popup_candidates(soup: BeautifulSoup, product_name: str) -> list[st
 
 def _normalize_popup_candidate(text: str, variant_hint: str) -> str:
     t = clean_noise(_slice_after_label(_strip_label_prefix(text or "")))
-    t = re.sub(r"^ingredients?\s+", "", t, flags=re.IGNORECASE).strip()
+    t = _LEADING_INGREDIENTS_RE.sub("", t).strip()
     if variant_hint:
         t = re.sub(rf"^{re.escape(variant_hint)}\b[\s:：-]*", "", t, flags=re.IGNORECASE).strip()
     return _normalize_space(t)
 
 
-def _extract_variant_popup_ingredients(soup: BeautifulSoup, html: str, product_name: str) -> Optional[ExtractedIngredients]:
+def _extract_variant_popup_ingredients(soup: BeautifulSoup, product_name: str) -> Optional[ExtractedIngredients]:
     variant_hint = _variant_hint(product_name)
     if not variant_hint:
         return None
 
     matches: list[str] = []
     saw_popup_labels: set[str] = set()
-    for popup in soup.select(".ingredients-popup, [class*='ingredients-popup']"):
+    for popup in _POPUP_SELECTOR.select(soup):
         paragraphs = popup.find_all(["p", "li"])
         saw_popup_labels.update(label.lower() for label in _popup_variant_labels(popup))
         for index, el in enumerate(paragraphs):
@@ -380,7 +425,7 @@ def _extract_variant_popup_ingredients(soup: BeautifulSoup, html: str, product_n
 
     best = sorted(matches, key=lambda s: (-_feature_score(s), len(s)))[0]
     score = _feature_score(best)
-    verified = verify_token_in_dom(html, best)
+    verified = _verify_in_soup(soup, best)
     debug = f"popup_variant={variant_hint} candidates={len(matches)} score={score:.2f} verified={verified}"
     return ExtractedIngredients(text=best, score=score, verified_in_dom=verified, debug_hint=debug)
 
@@ -391,7 +436,7 @@ def _collect_candidates(soup: BeautifulSoup, keywords: list[str], product_name:
     candidates.extend(_collect_popup_candidates(soup, product_name))
 
     # 1) Elements with ingredient-ish id/class.
-    for el in soup.select("[id*='ingredient'],[class*='ingredient'],[data-testid*='ingredient']"):
+    for el in _INGREDIENT_BLOCK_SELECTOR.select(soup):
         txt = _normalize_space(el.get_text(" ", strip=True))
         if txt and len(txt) > 10:
             candidates.append(txt)
@@ -430,15 +475,47 @@ def _collect_candidates(soup: BeautifulSoup, keywords: list[str], product_name:
     return candidates
 
 
+# Rows of one import often share a PDP (same product, different SKUs), so extraction results are
+# memoized by a digest of the HTML rather than the HTML itself to keep keys small.
+_EXTRACT_CACHE: OrderedDict[tuple[bytes, str, str], Optional[ExtractedIngredients]] = OrderedDict()
+_EXTRACT_CACHE_LOCK = threading.Lock()
+
+
+def clear_extract_cache() -> None:
+    with _EXTRACT_CACHE_LOCK:
+        _EXTRACT_CACHE.clear()
+
+
 def extract_ingredients(html: str, *, market: str, product_name: str = "") -> Optional[ExtractedIngredients]:
     if not html:
         return None
+    max_size = max(0, settings.extract_cache_size)
+    if not max_size:
+        return _extract_ingredients_uncached(html, market=market, product_name=product_name)
+
+    digest = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    key = (digest, market or "", product_name or "")
+    with _EXTRACT_CACHE_LOCK:
+        if key in _EXTRACT_CACHE:
+            _EXTRACT_CACHE.move_to_end(key)
+            return _EXTRACT_CACHE[key]
+
+    result = _extract_ingredients_uncached(html, market=market, product_name=product_name)
+    with _EXTRACT_CACHE_LOCK:
+        _EXTRACT_CACHE[key] = result
+        _EXTRACT_CACHE.move_to_end(key)
+        while len(_EXTRACT_CACHE) > max_size:
+            _EXTRACT_CACHE.popitem(last=False)
+    return result
+
+
+def _extract_ingredients_uncached(html: str, *, market: str, product_name: str = "") -> Optional[ExtractedIngredients]:
     soup = BeautifulSoup(html, "lxml")
     _strip_non_content_tags(soup)
     market_upper = (market or "").strip().upper()
     keywords = KEYWORDS_ZH if market_upper in {"CN", "CHN", "CHINA"} else KEYWORDS_EN
 
-    popup_match = _extract_variant_popup_ingredients(soup, html, product_name)
+    popup_match = _extract_variant_popup_ingredients(soup, product_name)
     if popup_match is not None:
         return popup_match
 
@@ -459,7 +536,7 @@ def extract_ingredients(html: str, *, market: str, product_name: str = "") -> Op
     # Deduplicate (case/space-insensitive) to reduce repeats.
     uniq: dict[str, str] = {}
     for t in cleaned:
-        key = re.sub(r"\s+", " ", t).strip().lower()
+        key = _WS_RE.sub(" ", t).strip().lower()
         if key and key not in uniq:
             uniq[key] = t
     cleaned = list(uniq.values())
@@ -472,6 +549,6 @@ def extract_ingredients(html: str, *, market: str, product_name: str = "") -> Op
 
     best = cleaned[0]
     score = _feature_score(best)
-    verified = verify_token_in_dom(html, best)
+    verified = _verify_in_soup(soup, best)
     debug = f"candidates={len(cleaned)} score={score:.2f} verified={verified}"
     return ExtractedIngredients(text=best, score=score, verified_in_dom=verified, debug_hint=debug)
@@ -17,7 +17,7 @@ USER_AGENTS = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FetchResult:
     url: str
     status_code: int
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 
 from app.harvester.extract import extract_ingredients
-from app.harvester.fetch import fetch_html
+from app.harvester.fetch import FetchResult, fetch_html
 from app.harvester.search import SearchEngine, default_search_engine
 
 
@@ -27,6 +29,7 @@ OFFICIAL_HOST_ALLOWLIST = {
 }
 
 
+@lru_cache(maxsize=4096)
 def official_hosts_for_brand(brand: str) -> tuple[str, ...]:
     normalized_brand = (brand or "").strip().lower()
     if not normalized_brand:
@@ -58,7 +61,31 @@ def classify_source_type(url: str) -> str:
     return "Official"
 
 
-@dataclass(frozen=True)
+MAX_URLS_PER_ATTEMPT = 3
+
+
+def _fetch_or_error(url: str) -> FetchResult | BaseException:
+    try:
+        return fetch_html(url)
+    except Exception as exc:  # noqa: BLE001
+        return exc
+
+
+def fetch_many(urls: list[str]) -> list[FetchResult | BaseException]:
+    """Fetch URLs on a small thread pool so a group costs max(latency) rather than the sum.
+
+    requests releases the GIL on socket I/O, so threads are enough here. Results keep the input
+    order; a failed fetch yields its exception instead of aborting the group.
+    """
+    if not urls:
+        return []
+    if len(urls) == 1:
+        return [_fetch_or_error(urls[0])]
+    with ThreadPoolExecutor(max_workers=min(len(urls), 4)) as ex:
+        return list(ex.map(_fetch_or_error, urls))
+
+
+@dataclass(frozen=True, slots=True)
 class HarvestOutcome:
     status: str
     confidence: float
@@ -90,9 +117,12 @@ class SourceHarvester:
         def attempt_urls(urls: list[str]) -> Optional[HarvestOutcome]:
             nonlocal best_pending
             nonlocal best_rank
-            try:
-                for url in urls[:3]:
-                    fetched = fetch_html(url)
+            batch = urls[:MAX_URLS_PER_ATTEMPT]
+            for url, fetched in zip(batch, fetch_many(batch)):
+                if isinstance(fetched, BaseException):
+                    debug["attempts"].append({"url": url, "error": str(fetched)[:200]})
+                    continue
+                try:
                     if fetched.status_code >= 400:
                         debug["attempts"].append({"url": url, "error": f"http_{fetched.status_code}"})
                         continue
@@ -144,8 +174,8 @@ class SourceHarvester:
                             "url": fetched.url,
                             "hint": extracted.debug_hint,
                         }
-            except Exception as exc:  # noqa: BLE001
-                debug["attempts"].append({"url": urls[0] if urls else "", "error": str(exc)[:200]})
+                except Exception as exc:  # noqa: BLE001
+                    debug["attempts"].append({"url": url, "error": str(exc)[:200]})
             return None
 
         preferred_result = attempt_urls(preferred)
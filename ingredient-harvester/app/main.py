@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import io
+import itertools
 import json
 import os
 import threading
@@ -23,7 +24,7 @@ from app.config import settings
 from app.db import db_session, engine, utcnow
 from app.jobs import harvest_row
 from app.models import Base, CandidateRow, HarvestTask, ImportBatch, TaskRow, CandidateRowAuditFinding, CandidateRowCorrection
-from app.parser_runtime import build_parser_snapshot, parser_error, parser_ready
+from app.parser_runtime import build_parser_snapshot, build_parser_snapshots, parser_error, parser_ready
 from app.quality import (
     build_audit_findings,
     compute_audit_status,
@@ -61,6 +62,8 @@ _DB_INIT_ATTEMPTS = int((os.getenv("HARVESTER_DB_INIT_ATTEMPTS") or "8").strip()
 _DB_RETRY_INTERVAL_S = float((os.getenv("HARVESTER_DB_RETRY_INTERVAL_S") or "10").strip() or "10")
 _DB_INIT_LOCK = threading.Lock()
 _DB_LAST_TRY_AT = 0.0
+_IMPORT_CHUNK_ROWS = int((os.getenv("HARVESTER_IMPORT_CHUNK_ROWS") or "10000").strip() or "10000")
+_EMPTY_TEXT_MARKERS = ("nan", "none", "null", "n/a", "na")
 
 
 def _loads_json(value: Any, default: Any) -> Any:
@@ -89,11 +92,11 @@ def _to_parser_response(snapshot: dict[str, Any]) -> ParserReparseResponse:
         cleaned_text=str(snapshot.get("cleaned_text") or ""),
         parse_status=str(snapshot.get("parse_status") or "NEEDS_REVIEW"),
         inci_list=str(snapshot.get("inci_list") or ""),
-        inci_list_json=_loads_json(snapshot.get("inci_list_json"), []),
-        unrecognized_tokens=_loads_json(snapshot.get("unrecognized_tokens"), []),
-        normalization_notes=_loads_json(snapshot.get("normalization_notes"), []),
+        inci_list_json=_loads_json(snapshot.get("inci_list_json"), ()),
+        unrecognized_tokens=_loads_json(snapshot.get("unrecognized_tokens"), ()),
+        normalization_notes=_loads_json(snapshot.get("normalization_notes"), ()),
         parse_confidence=float(snapshot.get("parse_confidence") or 0.0),
-        needs_review=_loads_json(snapshot.get("needs_review"), []),
+        needs_review=_loads_json(snapshot.get("needs_review"), ()),
     )
 
 
@@ -241,10 +244,10 @@ def _row_view(row: CandidateRow) -> CandidateRowView:
         parse_status=row.parse_status,  # type: ignore[arg-type]
         parse_confidence=row.parse_confidence,
         inci_list=row.inci_list,
-        inci_list_json=_loads_json(row.inci_list_json, []),
-        unrecognized_tokens=_loads_json(row.unrecognized_tokens_json, []),
-        normalization_notes=_loads_json(row.normalization_notes_json, []),
-        needs_review=_loads_json(row.needs_review_json, []),
+        inci_list_json=_loads_json(row.inci_list_json, ()),
+        unrecognized_tokens=_loads_json(row.unrecognized_tokens_json, ()),
+        normalization_notes=_loads_json(row.normalization_notes_json, ()),
+        needs_review=_loads_json(row.needs_review_json, ()),
         review_status=(row.review_status or "UNREVIEWED"),  # type: ignore[arg-type]
         reviewed_by=row.reviewed_by,
         reviewed_at=row.reviewed_at,
@@ -592,11 +595,20 @@ def _clean_existing(value: Any) -> str:
     text = str(value).strip()
     if not text:
         return ""
-    if text.lower() in {"nan", "none", "null", "n/a", "na"}:
+    if text.lower() in _EMPTY_TEXT_MARKERS:
         return ""
     return text
 
 
+def _clean_column(chunk: pd.DataFrame, column: str) -> list[str]:
+    """Column-wise `_clean_existing` so import chunks avoid per-cell isna/str round-trips."""
+    if not column:
+        return [""] * len(chunk)
+    series = chunk[column]
+    text = series.astype(object).where(series.notna(), "").astype(str).str.strip()
+    return text.mask(text.str.lower().isin(_EMPTY_TEXT_MARKERS), "").tolist()
+
+
 def _safe_float(value: Any) -> float | None:
     text = _clean_existing(value)
     if not text:
@@ -697,31 +709,81 @@ def _maybe_refresh_parser_snapshot(row: CandidateRow) -> None:
     _apply_parser_snapshot_to_row(row, snapshot)
 
 
+def _import_columns(df: pd.DataFrame) -> dict[str, str]:
+    return {
+        "brand": _find_column(df, "brand", "brand_en", "brand_zh", "brand_original"),
+        "product_name": _find_column(
+            df, "product_name", "product", "product_name_en", "product_name_zh", "product_name_original", "product title"
+        ),
+        "market": _find_column(df, "market", "country", "region"),
+        "raw_ingredient_text": _find_column(df, "raw_ingredient_text", "ingredients", "ingredient_text"),
+        "candidate_id": _find_column(df, "candidate_id"),
+        "sku_key": _find_column(df, "sku_key", "sku"),
+        "external_seed_id": _find_column(df, "external_seed_id", "seed_id"),
+        "external_product_id": _find_column(df, "external_product_id"),
+        "source_ref": _find_column(df, "source_ref", "source_url", "url"),
+        "source_type": _find_column(df, "source_type"),
+        "status": _find_column(df, "status", "harvest_status"),
+        "confidence": _find_column(df, "confidence", "harvest_confidence"),
+    }
+
+
+def _import_chunk_rows(import_id: str, chunk: pd.DataFrame, columns: dict[str, str]) -> list[CandidateRow]:
+    cleaned = {name: _clean_column(chunk, column) for name, column in columns.items()}
+    out: list[CandidateRow] = []
+    for position, idx in enumerate(chunk.index):
+        brand = cleaned["brand"][position]
+        product_name = cleaned["product_name"][position]
+        market = cleaned["market"][position]
+        if not (brand and product_name and market):
+            continue
+        existing = cleaned["raw_ingredient_text"][position]
+        imported_status = cleaned["status"][position]
+        candidate_id = cleaned["candidate_id"][position]
+        sku_key = cleaned["sku_key"][position]
+        source_ref = cleaned["source_ref"][position]
+        row = CandidateRow(
+            import_id=import_id,
+            row_index=int(idx),
+            brand=brand,
+            product_name=product_name,
+            market=market,
+            candidate_id=candidate_id or None,
+            sku_key=(sku_key or candidate_id) or None,
+            external_seed_id=cleaned["external_seed_id"][position] or None,
+            external_product_id=cleaned["external_product_id"][position] or None,
+            raw_ingredient_text=existing or None,
+            source_ref=(normalize_url_like(source_ref) or source_ref) or None,
+            source_type=cleaned["source_type"][position] or None,
+            status=imported_status or ("SKIPPED" if existing else "EMPTY"),
+            confidence=_safe_float(cleaned["confidence"][position]) if columns["confidence"] else (1.0 if existing else None),
+            updated_at=utcnow(),
+        )
+        if existing:
+            _maybe_refresh_parser_snapshot(row)
+            _reset_audit_state(row)
+        out.append(row)
+    return out
+
+
 @app.post("/v1/imports", response_model=ImportResponse)
 async def create_import(file: UploadFile = File(...)) -> ImportResponse:
     _require_db()
     if not file.filename or not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="Please upload a .csv file.")
-    raw = await file.read()
+    # Read the upload in bounded chunks so peak memory tracks one chunk rather than the whole catalog.
+    # Cells are read as text: per-chunk dtype inference would store an id as "7" in one chunk and "7.0" in
+    # the next when only some chunks have blanks.
     try:
-        df = pd.read_csv(io.BytesIO(raw))
+        reader = pd.read_csv(file.file, chunksize=max(1, _IMPORT_CHUNK_ROWS), dtype=str)
+        first_chunk = next(reader, None)
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=400, detail=f"CSV parse failed: {exc}") from exc
+    if first_chunk is None:
+        first_chunk = pd.DataFrame()
 
-    brand_col = _find_column(df, "brand", "brand_en", "brand_zh", "brand_original")
-    product_col = _find_column(df, "product_name", "product", "product_name_en", "product_name_zh", "product_name_original", "product title")
-    market_col = _find_column(df, "market", "country", "region")
-    raw_ing_col = _find_column(df, "raw_ingredient_text", "ingredients", "ingredient_text")
-    candidate_id_col = _find_column(df, "candidate_id")
-    sku_key_col = _find_column(df, "sku_key", "sku")
-    external_seed_id_col = _find_column(df, "external_seed_id", "seed_id")
-    external_product_id_col = _find_column(df, "external_product_id")
-    source_ref_col = _find_column(df, "source_ref", "source_url", "url")
-    source_type_col = _find_column(df, "source_type")
-    status_col = _find_column(df, "status", "harvest_status")
-    confidence_col = _find_column(df, "confidence", "harvest_confidence")
-
-    if not brand_col or not product_col or not market_col:
+    columns = _import_columns(first_chunk)
+    if not columns["brand"] or not columns["product_name"] or not columns["market"]:
         raise HTTPException(
             status_code=400,
             detail="CSV must contain columns: brand, product_name, market (case-insensitive).",
@@ -730,43 +792,25 @@ async def create_import(file: UploadFile = File(...)) -> ImportResponse:
     with db_session() as db:
         batch = ImportBatch(filename=file.filename)
         db.add(batch)
-        db.commit()
-        db.refresh(batch)
+        db.flush()
 
         total = 0
-        for idx, r in df.iterrows():
-            brand = _clean_existing(r.get(brand_col))
-            product_name = _clean_existing(r.get(product_col))
-            market = _clean_existing(r.get(market_col))
-            if not (brand and product_name and market):
-                continue
-            existing = _clean_existing(r.get(raw_ing_col)) if raw_ing_col else ""
-            imported_status = _clean_existing(r.get(status_col)) if status_col else ""
-            candidate_id = _clean_existing(r.get(candidate_id_col)) if candidate_id_col else ""
-            sku_key = _clean_existing(r.get(sku_key_col)) if sku_key_col else ""
-            row = CandidateRow(
-                import_id=batch.import_id,
-                row_index=int(idx),
-                brand=brand,
-                product_name=product_name,
-                market=market,
-                candidate_id=candidate_id or None,
-                sku_key=(sku_key or candidate_id) or None,
-                external_seed_id=_clean_existing(r.get(external_seed_id_col)) or None if external_seed_id_col else None,
-                external_product_id=_clean_existing(r.get(external_product_id_col)) or None if external_product_id_col else None,
-                raw_ingredient_text=existing or None,
-                source_ref=(normalize_url_like(r.get(source_ref_col)) or _clean_existing(r.get(source_ref_col))) or None if source_ref_col else None,
-                source_type=_clean_existing(r.get(source_type_col)) or None if source_type_col else None,
-                status=imported_status or ("SKIPPED" if existing else "EMPTY"),
-                confidence=_safe_float(r.get(confidence_col)) if confidence_col else (1.0 if existing else None),
-                updated_at=utcnow(),
-            )
-            if existing:
-                _maybe_refresh_parser_snapshot(row)
-                _reset_audit_state(row)
-            db.add(row)
-            total += 1
+        chunks = itertools.chain([first_chunk], reader)
+        while True:
+            try:
+                chunk = next(chunks, None)
+            except Exception as exc:  # noqa: BLE001
+                # Keep imports all-or-nothing: a malformed later chunk discards the rows flushed so far.
+                db.rollback()
+                raise HTTPException(status_code=400, detail=f"CSV parse failed: {exc}") from exc
+            if chunk is None:
+                break
+            rows = _import_chunk_rows(batch.import_id, chunk, columns)
+            db.add_all(rows)
+            db.flush()
+            total += len(rows)
         db.commit()
+        db.refresh(batch)
 
         return ImportResponse(import_id=batch.import_id, filename=batch.filename, created_at=batch.created_at, total_rows=total)
 
@@ -780,14 +824,12 @@ def parser_reparse(req: ParserReparseRequest) -> ParserReparseResponse:
 @app.post("/v1/parser/re-parse-batch", response_model=ParserReparseBatchResponse)
 def parser_reparse_batch(req: ParserReparseBatchRequest) -> ParserReparseBatchResponse:
     _require_parser()
-    out: list[ParserReparseBatchResponseItem] = []
-    for item in req.items or []:
-        out.append(
-            ParserReparseBatchResponseItem(
-                row_id=item.row_id,
-                result=_to_parser_response(build_parser_snapshot(item.raw_ingredient_text)),
-            )
-        )
+    items = req.items or []
+    snapshots = build_parser_snapshots([item.raw_ingredient_text for item in items])
+    out = [
+        ParserReparseBatchResponseItem(row_id=item.row_id, result=_to_parser_response(snapshot))
+        for item, snapshot in zip(items, snapshots)
+    ]
     return ParserReparseBatchResponse(items=out)
 
 
@@ -10,8 +10,7 @@ from typing import Any
 _PARSER_ENGINE: Any = None
 _PARSER_ERROR: str | None = None
 _PARSER_COERCE_TEXT = None
-_PARSER_PREPROCESS = None
-_PARSER_CLEAN_NOISE = None
+_PARSER_CLEAN_TEXT = None
 
 
 def _load_parser_module():
@@ -35,14 +34,12 @@ def _load_parser_module():
 try:
     parser_module = _load_parser_module()
     ParserEngine = parser_module.ParserEngine
-    clean_noise = parser_module.clean_noise
     parser_coerce_text = parser_module._coerce_text
-    parser_preprocess = parser_module._preprocess
+    parser_clean_text = parser_module._clean_and_preprocess
 
     _PARSER_ENGINE = ParserEngine()
     _PARSER_COERCE_TEXT = parser_coerce_text
-    _PARSER_PREPROCESS = parser_preprocess
-    _PARSER_CLEAN_NOISE = clean_noise
+    _PARSER_CLEAN_TEXT = parser_clean_text
 except Exception as exc:  # noqa: BLE001
     _PARSER_ENGINE = None
     _PARSER_ERROR = f"Parser unavailable: {type(exc).__name__}: {exc!s}"[:300]
@@ -63,11 +60,40 @@ def require_parser() -> Any:
 
 
 def build_parser_snapshot(raw_ingredient_text: Any) -> dict[str, Any]:
+    return _build_snapshot(require_parser(), raw_ingredient_text)
+
+
+def build_parser_snapshots(raw_ingredient_texts: list[Any]) -> list[dict[str, Any]]:
+    """Snapshot a batch in one pass: the engine is resolved once and repeated texts are parsed once.
+
+    Duplicate inputs share the same snapshot dict, so callers must treat results as read-only.
+    """
     engine = require_parser()
-    raw = _PARSER_COERCE_TEXT(raw_ingredient_text) if _PARSER_COERCE_TEXT else str(raw_ingredient_text or "")
-    pre = _PARSER_PREPROCESS(raw) if _PARSER_PREPROCESS else raw
-    cleaned, _ = _PARSER_CLEAN_NOISE(pre) if _PARSER_CLEAN_NOISE else (raw, [])
-    parsed = engine.parse(raw)
+    by_text: dict[str, dict[str, Any]] = {}
+    out: list[dict[str, Any]] = []
+    for raw_ingredient_text in raw_ingredient_texts:
+        key = _coerce(raw_ingredient_text)
+        snapshot = by_text.get(key)
+        if snapshot is None:
+            snapshot = _build_snapshot(engine, key)
+            by_text[key] = snapshot
+        out.append(snapshot)
+    return out
+
+
+def _coerce(raw_ingredient_text: Any) -> str:
+    return _PARSER_COERCE_TEXT(raw_ingredient_text) if _PARSER_COERCE_TEXT else str(raw_ingredient_text or "")
+
+
+def _build_snapshot(engine: Any, raw_ingredient_text: Any) -> dict[str, Any]:
+    raw = _coerce(raw_ingredient_text)
+    if _PARSER_CLEAN_TEXT:
+        # Clean once and parse the cleaned text, rather than letting engine.parse() clean it again.
+        cleaned, noise_notes = _PARSER_CLEAN_TEXT(raw)
+        parsed = engine.parse_cleaned(cleaned, noise_notes)
+    else:
+        cleaned = raw
+        parsed = engine.parse(raw)
     return {
         "cleaned_text": cleaned or "",
         "parse_status": str(parsed.get("parse_status") or "NEEDS_REVIEW"),
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from typing import Any, Optional
 from urllib.parse import urlparse
 
@@ -26,6 +27,9 @@ STOP_TOKENS = {
     "travel",
 }
 
+URL_SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.-]*://", re.IGNORECASE)
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 MARKETING_COPY_RE = re.compile(
     r"("
     r"experience\s+the\s+ultimate\s+luxury"
@@ -89,7 +93,7 @@ def normalize_url_like(value: Any) -> str:
     raw = normalize_nonempty_string(value)
     if not raw:
         return ""
-    if re.match(r"^[a-z][a-z0-9+.-]*://", raw, re.IGNORECASE):
+    if URL_SCHEME_RE.match(raw):
         return raw
     if raw.startswith("www.") or "." in raw.split("/", 1)[0]:
         return f"https://{raw}"
@@ -123,6 +127,7 @@ def _normalized_host(source_ref: str) -> str:
         return ""
 
 
+@lru_cache(maxsize=4096)
 def _official_hosts_for_brand(brand: str) -> tuple[str, ...]:
     normalized_brand = normalize_nonempty_string(brand).lower()
     if not normalized_brand:
@@ -149,7 +154,7 @@ def _host_matches_allowlist(host: str, allowed_hosts: tuple[str, ...]) -> bool:
 def _tokenize(text: str) -> set[str]:
     base_tokens = {
         token
-        for token in re.findall(r"[a-z0-9]+", (text or "").lower())
+        for token in TOKEN_RE.findall((text or "").lower())
         if (len(token) >= 4 or (len(token) >= 3 and any(ch.isdigit() for ch in token))) and token not in STOP_TOKENS
     }
     tokens = set(base_tokens)
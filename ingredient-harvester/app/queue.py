@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Optional
-
-from redis import Redis
-from rq import Queue
+from typing import TYPE_CHECKING, Optional
 
 from app.config import settings
 
+if TYPE_CHECKING:
+    from redis import Redis
+
 
 @dataclass(frozen=True)
 class JobRef:
@@ -18,6 +18,8 @@ class JobRef:
 def _redis() -> Optional[Redis]:
     if not settings.redis_url:
         return None
+    from redis import Redis
+
     return Redis.from_url(settings.redis_url)
 
 
@@ -30,6 +32,8 @@ def enqueue(function_path: str, *, kwargs: dict, job_id: Optional[str] = None) -
     redis_conn = _redis()
     if not redis_conn:
         return None
+    from rq import Queue
+
     qname = os.getenv("HARVESTER_RQ_QUEUE", "ingredient-harvester")
     q = Queue(qname, connection=redis_conn)
     job = q.enqueue(function_path, kwargs=kwargs, job_id=job_id)
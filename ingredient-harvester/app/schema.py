@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal, Optional, Sequence
 
 from pydantic import BaseModel, Field
 
@@ -23,6 +23,8 @@ class ImportResponse(BaseModel):
 
 
 class CandidateRowView(BaseModel):
+    # Response-only list fields default to the shared empty tuple (tuple() allocates nothing); they still
+    # serialize, and appear in the OpenAPI schema, as arrays.
     row_id: str
     row_index: int
     brand: str
@@ -41,10 +43,10 @@ class CandidateRowView(BaseModel):
     parse_status: Optional[ParseStatus] = None
     parse_confidence: Optional[float] = None
     inci_list: Optional[str] = None
-    inci_list_json: list[dict] = Field(default_factory=list)
-    unrecognized_tokens: list[str] = Field(default_factory=list)
-    normalization_notes: list[str] = Field(default_factory=list)
-    needs_review: list[dict] = Field(default_factory=list)
+    inci_list_json: Sequence[dict] = Field(default_factory=tuple)
+    unrecognized_tokens: Sequence[str] = Field(default_factory=tuple)
+    normalization_notes: Sequence[str] = Field(default_factory=tuple)
+    needs_review: Sequence[dict] = Field(default_factory=tuple)
     review_status: ReviewStatus = "UNREVIEWED"
     reviewed_by: Optional[str] = None
     reviewed_at: Optional[datetime] = None
@@ -164,11 +166,11 @@ class ParserReparseResponse(BaseModel):
     cleaned_text: str
     parse_status: ParseStatus
     inci_list: str
-    inci_list_json: list[dict] = Field(default_factory=list)
-    unrecognized_tokens: list[str] = Field(default_factory=list)
-    normalization_notes: list[str] = Field(default_factory=list)
+    inci_list_json: Sequence[dict] = Field(default_factory=tuple)
+    unrecognized_tokens: Sequence[str] = Field(default_factory=tuple)
+    normalization_notes: Sequence[str] = Field(default_factory=tuple)
     parse_confidence: float
-    needs_review: list[dict] = Field(default_factory=list)
+    needs_review: Sequence[dict] = Field(default_factory=tuple)
 
 
 class ParserReparseBatchItem(BaseModel):
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import os
+
+import uvicorn
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = (os.getenv(name) or "").strip().lower()
+    if not raw:
+        return default
+    return raw in {"1", "true", "yes", "on"}
+
+
+def _web_workers() -> int:
+    # One process unless asked for more: every worker opens its own DB pool and runs startup schema
+    # init, and several writers on the default SQLite file fail with "database is locked".
+    for name in ("HARVESTER_WEB_WORKERS", "WEB_CONCURRENCY"):
+        raw = (os.getenv(name) or "").strip()
+        if raw:
+            return max(1, int(raw))
+    return 1
+
+
+def main() -> None:
+    workers = _web_workers()
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int((os.getenv("PORT") or "8008").strip() or "8008"),
+        workers=workers,
+        loop="auto",
+        http="auto",
+        access_log=_env_flag("HARVESTER_ACCESS_LOG", True),
+    )
+
+
+if __name__ == "__main__":
+    main()
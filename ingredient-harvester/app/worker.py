@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import os
 
-from redis import Redis
-from rq import Connection, Worker
-
 from app.config import settings
 
 
 def main() -> None:
     if not settings.redis_url:
         raise SystemExit("REDIS_URL is required to run worker (or set HARVESTER_QUEUE_MODE=inline).")
+    # Imported here so importing this module (tests, --help paths) doesn't pay for redis/rq.
+    from redis import Redis
+    from rq import Connection, Worker
+
     qname = os.getenv("HARVESTER_RQ_QUEUE", "ingredient-harvester")
     redis_conn = Redis.from_url(settings.redis_url)
     with Connection(redis_conn):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from app.harvester import extract as extract_mod
 from app.harvester.extract import extract_ingredients, verify_token_in_dom
 
 
@@ -21,6 +22,25 @@ def test_extract_ingredients_en_ok() -> None:
     assert extracted.verified_in_dom is True
 
 
+def test_extract_ingredients_reuses_cached_result_for_identical_html(monkeypatch) -> None:
+    extract_mod.clear_extract_cache()
+    calls = []
+    original = extract_mod._extract_ingredients_uncached
+
+    def counting(html: str, *, market: str, product_name: str = ""):
+        calls.append((market, product_name))
+        return original(html, market=market, product_name=product_name)
+
+    monkeypatch.setattr(extract_mod, "_extract_ingredients_uncached", counting)
+
+    first = extract_ingredients(HTML_EN, market="US", product_name="P1")
+    second = extract_ingredients(HTML_EN, market="US", product_name="P1")
+    extract_ingredients(HTML_EN, market="CN", product_name="P1")
+    assert first is second
+    assert calls == [("US", "P1"), ("CN", "P1")]
+    extract_mod.clear_extract_cache()
+
+
 def test_verify_token_in_dom_false_when_missing() -> None:
     assert verify_token_in_dom("<html><body>nope</body></html>", "Water, Glycerin") is False
 
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import io
+from contextlib import contextmanager
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+import app.main as main_mod
+from app.models import Base, CandidateRow, ImportBatch
+
+
+def _patch_db(monkeypatch) -> sessionmaker:  # type: ignore[no-untyped-def]
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    @contextmanager
+    def fake_session():  # type: ignore[no-untyped-def]
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(main_mod, "db_session", fake_session)
+    monkeypatch.setattr(main_mod, "_DB_READY", True)
+    monkeypatch.setattr(main_mod, "_IMPORT_CHUNK_ROWS", 2)
+    return factory
+
+
+def _upload(text: str) -> UploadFile:
+    return UploadFile(file=io.BytesIO(text.encode("utf-8")), filename="batch.csv")
+
+
+def test_create_import_streams_chunks_and_keeps_row_indexes(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    factory = _patch_db(monkeypatch)
+    csv_text = (
+        "Brand,Product_Name,Market,Ingredients,URL,Confidence\n"
+        "Acme,Cream,US,\"Water, Glycerin\",example.com/cream,0.8\n"
+        "Acme,Serum,US,,,\n"
+        "Acme,Toner,,Water,,\n"
+        "Acme,Mask,N/A,Water,,\n"
+        "Acme,Balm,US,nan,https://example.com/balm,\n"
+    )
+
+    resp = asyncio.run(main_mod.create_import(_upload(csv_text)))
+    assert resp.total_rows == 3
+
+    with factory() as db:
+        rows = db.scalars(select(CandidateRow).order_by(CandidateRow.row_index)).all()
+    assert [r.row_index for r in rows] == [0, 1, 4]
+    assert [r.product_name for r in rows] == ["Cream", "Serum", "Balm"]
+    assert rows[0].raw_ingredient_text == "Water, Glycerin"
+    assert rows[0].source_ref == "https://example.com/cream"
+    assert rows[0].confidence == pytest.approx(0.8)
+    assert rows[0].status == "SKIPPED"
+    assert rows[1].raw_ingredient_text is None
+    assert rows[1].source_ref is None
+    assert rows[1].status == "EMPTY"
+    assert rows[2].raw_ingredient_text is None
+    assert rows[2].source_ref == "https://example.com/balm"
+
+
+def test_create_import_keeps_id_spelling_across_chunks(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    factory = _patch_db(monkeypatch)
+    csv_text = (
+        "brand,product_name,market,candidate_id,sku_key\n"
+        "Acme,Cream,US,7,00123\n"
+        "Acme,Serum,US,8,00124\n"
+        "Acme,Toner,US,9,\n"
+    )
+
+    asyncio.run(main_mod.create_import(_upload(csv_text)))
+
+    with factory() as db:
+        rows = db.scalars(select(CandidateRow).order_by(CandidateRow.row_index)).all()
+    assert [r.candidate_id for r in rows] == ["7", "8", "9"]
+    assert [r.sku_key for r in rows] == ["00123", "00124", "9"]
+
+
+def test_create_import_rolls_back_when_a_later_chunk_is_malformed(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    factory = _patch_db(monkeypatch)
+    csv_text = (
+        "brand,product_name,market\n"
+        "Acme,Cream,US\n"
+        "Acme,Serum,US\n"
+        "Acme,Toner,US\n"
+        "Acme,\"Unterminated,US\n"
+    )
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(main_mod.create_import(_upload(csv_text)))
+    assert excinfo.value.status_code == 400
+
+    with factory() as db:
+        assert db.scalars(select(ImportBatch)).all() == []
+        assert db.scalars(select(CandidateRow)).all() == []
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+
+SERVICES_DIR = Path(__file__).resolve().parents[2] / "services"
+if str(SERVICES_DIR) not in sys.path:
+    sys.path.insert(0, str(SERVICES_DIR))
+
+import ingredient_parser  # noqa: E402
+from ingredient_parser import ParserEngine, _coerce_text, _preprocess, clean_noise  # noqa: E402
+
+
+RAW_VALUES = [
+    "Ingredients: Aqua (Water), Glycerin, Niacinamide, Phenoxyethanol.",
+    "#vegan Water, Glycerin, Niacinamide, [more] Phenoxyethanol. Read more",
+    "Water​, Glycerin, and...",
+    "Water, Glycerin, etc.",
+    "全成分：水，甘油，烟酰胺",
+    "See https://example.com/p for Water, Glycerin",
+    "Water, Glycerin, and...",
+    None,
+    float("nan"),
+    "n/a",
+    "",
+]
+
+
+def test_preclean_series_matches_row_wise_cleaning() -> None:
+    cleaned, notes = ParserEngine.preclean_series(pd.Series(RAW_VALUES, dtype=object))
+
+    expected = [clean_noise(_preprocess(_coerce_text(v))) for v in RAW_VALUES]
+    assert list(zip(cleaned, notes)) == expected
+
+
+def test_parse_cleaned_matches_parse() -> None:
+    engine = ParserEngine()
+    cleaned, notes = ParserEngine.preclean_series(pd.Series(RAW_VALUES, dtype=object))
+
+    for raw, clean, noise_notes in zip(RAW_VALUES, cleaned, notes):
+        assert engine.parse_cleaned(clean, noise_notes) == engine.parse(raw)
+
+
+def test_parse_all_in_worker_pool_preserves_row_order(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(ingredient_parser, "_PARALLEL_MIN_ROWS", 1)
+    monkeypatch.setattr(ingredient_parser, "_POOL_CHUNKSIZE", 2)
+    engine = ParserEngine()
+    cleaned, notes = ParserEngine.preclean_series(pd.Series(RAW_VALUES * 3, dtype=object))
+
+    assert ingredient_parser._start_pool(1) is None
+    serial = ingredient_parser._parse_all(engine, cleaned, notes)
+    with ingredient_parser._start_pool(2) as pool:
+        parallel = ingredient_parser._parse_all(engine, cleaned, notes, pool)
+        # The same pool serves later calls (one per streamed chunk).
+        again = ingredient_parser._parse_all(engine, cleaned, notes, pool)
+    assert parallel == serial == again
+
+
+def test_parse_cache_reuses_results_and_returns_copies() -> None:
+    engine = ParserEngine()
+    first = engine.parse(RAW_VALUES[0])
+    first["inci_list"] = "mutated"
+    second = engine.parse(RAW_VALUES[0])
+
+    assert second["inci_list"] != "mutated"
+    assert engine.cache_info()["hits"] == 1
+    assert engine.cache_info()["misses"] == 1
+    assert engine.cache_info()["hit_rate"] == 0.5
+
+
+def test_main_streams_chunks_to_the_same_output(tmp_path, capsys) -> None:  # type: ignore[no-untyped-def]
+    src = tmp_path / "in.csv"
+    pd.DataFrame({"sku": range(len(RAW_VALUES)), "raw_ingredient_text": RAW_VALUES}).to_csv(src, index=False)
+
+    whole, chunked = tmp_path / "whole.csv", tmp_path / "chunked.csv"
+    assert ingredient_parser.main(["--input", str(src), "--output", str(whole), "--demo-rows", "3"]) == 0
+    whole_demo = capsys.readouterr().out
+    args = ["--input", str(src), "--output", str(chunked), "--demo-rows", "3", "--chunk-rows", "2"]
+    assert ingredient_parser.main(args) == 0
+
+    assert chunked.read_bytes() == whole.read_bytes()
+    assert capsys.readouterr().out == whole_demo
+    assert len(pd.read_csv(chunked)) == len(RAW_VALUES)
+
+
+def test_main_keeps_pass_through_spelling_across_chunks(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    src = tmp_path / "in.csv"
+    src.write_text("sku,qty,raw_ingredient_text\n001,7,\"Water, Glycerin\"\n002,8,Water\n003,,Glycerin\n")
+
+    out = tmp_path / "out.csv"
+    assert ingredient_parser.main(["--input", str(src), "--output", str(out), "--demo-rows", "0", "--chunk-rows", "2"]) == 0
+
+    lines = out.read_text(encoding="utf-8-sig").splitlines()
+    assert [line.split(",")[:2] for line in lines[1:]] == [["001", "7"], ["002", "8"], ["003", ""]]
+
+
+def test_main_strips_bom_from_every_chunked_read(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    src = tmp_path / "in.csv"
+    src.write_text("raw_ingredient_text,sku\nWater,1\nGlycerin,2\nAqua,3\n", encoding="utf-8-sig")
+
+    out = tmp_path / "out.csv"
+    assert ingredient_parser.main(["--input", str(src), "--output", str(out), "--demo-rows", "0", "--chunk-rows", "2"]) == 0
+
+    parsed = pd.read_csv(out, encoding="utf-8-sig")
+    assert parsed.columns[0] == "raw_ingredient_text"
+    assert parsed["inci_list"].tolist() == ["Aqua", "Glycerin", "Aqua"]
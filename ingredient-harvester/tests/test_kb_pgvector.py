@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+
+SERVICES_DIR = Path(__file__).resolve().parents[2] / "services"
+if str(SERVICES_DIR) not in sys.path:
+    sys.path.insert(0, str(SERVICES_DIR))
+
+import kb_pgvector  # noqa: E402
+from kb_pgvector import embedding_literals, hash_embedding, hash_embedding_batch, vector_literal, vector_literals  # noqa: E402
+
+
+TEXTS = [
+    "Water, Glycerin, Niacinamide, Glycerin, PEG-40 Hydrogenated Castor Oil",
+    "全成分：水，甘油，烟酰胺",
+    "o'neil x_y water water water",
+    "",
+    "!!!",
+]
+
+
+def test_hash_embedding_numpy_path_matches_scalar_fallback(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    vectorized = [hash_embedding(t, dim=dim) for t in TEXTS for dim in (384, 7, 1)]
+    monkeypatch.setattr(kb_pgvector, "np", None)
+    scalar = [hash_embedding(t, dim=dim) for t in TEXTS for dim in (384, 7, 1)]
+
+    assert vectorized == scalar
+    assert all(isinstance(v, float) for vec in vectorized for v in vec)
+
+
+def test_hash_embedding_batch_matches_per_text_embeddings() -> None:
+    for dim in (384, 7, 1):
+        assert hash_embedding_batch(TEXTS, dim=dim) == [hash_embedding(t, dim=dim) for t in TEXTS]
+    assert hash_embedding_batch([], dim=8) == []
+
+
+def test_vector_literal_formats_each_component() -> None:
+    vec = hash_embedding(TEXTS[0], dim=8)
+
+    assert vector_literal(vec) == "[" + ",".join(f"{v:.6f}" for v in vec) + "]"
+    assert vector_literal([0.5, -0.0, 0.0, 1, 0.5], max_decimals=2) == "[0.50,0.00,0.00,1.00,0.50]"
+    assert vector_literal([]) == "[]"
+
+
+def test_embedding_literals_match_per_row_vector_literal() -> None:
+    for dim in (384, 7, 1):
+        expected = [vector_literal(hash_embedding(t, dim=dim)) for t in TEXTS]
+        assert embedding_literals(TEXTS, dim=dim) == expected
+
+    matrix = [[0.0, -0.0, 1.5, 0.25], [0.0, 0.0, 0.0, 0.0], [1, 0, 0, 2]]
+    assert vector_literals(matrix, max_decimals=2) == [vector_literal(v, max_decimals=2) for v in matrix]
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
 import pandas as pd
+import pytest
 
 
 SERVICES_DIR = Path(__file__).resolve().parents[2] / "services"
 if str(SERVICES_DIR) not in sys.path:
     sys.path.insert(0, str(SERVICES_DIR))
 
-from kb_pgvector_ingest import build_rows, resolve_db_url  # noqa: E402
+import kb_pgvector_ingest  # noqa: E402
+from kb_pgvector_ingest import build_rows, iter_ingest_csv, read_ingest_csv, resolve_db_url  # noqa: E402
 
 
 def test_build_rows_applies_review_and_audit_gates() -> None:
@@ -64,6 +67,7 @@ def test_build_rows_applies_review_and_audit_gates() -> None:
     assert rows[0].review_status == "APPROVED"
     assert rows[0].audit_status == "PASS"
     assert rows[0].ingest_allowed is True
+    assert rows[0].inci_list_json == [{"order": 1, "standard_name": "Aqua"}]
 
 
 def test_resolve_db_url_prefers_dedicated_kb_env(monkeypatch) -> None:
@@ -71,3 +75,269 @@ def test_resolve_db_url_prefers_dedicated_kb_env(monkeypatch) -> None:
     monkeypatch.setenv("PCI_KB_DATABASE_URL", "postgresql://kb-db")
     assert resolve_db_url("") == "postgresql://kb-db"
     assert resolve_db_url("postgresql://explicit") == "postgresql://explicit"
+
+
+class _FakeCursor:
+    def __init__(self, calls: list, stored: list | None = None) -> None:  # type: ignore[type-arg]
+        self.calls = calls
+        self.stored = stored or []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: list | None = None) -> None:  # type: ignore[type-arg]
+        self.calls.append((sql, params))
+
+    def executemany(self, sql: str, rows: list) -> None:  # type: ignore[type-arg]
+        raise AssertionError("executemany should not be used")
+
+    def fetchall(self) -> list:  # type: ignore[type-arg]
+        return self.stored
+
+    def copy(self, sql: str) -> "_FakeCopy":
+        copy = _FakeCopy()
+        self.calls.append((sql, copy.rows))
+        return copy
+
+
+class _FakeCopy:
+    def __init__(self) -> None:
+        self.rows: list = []  # type: ignore[type-arg]
+
+    def __enter__(self) -> "_FakeCopy":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def write_row(self, row: tuple) -> None:  # type: ignore[type-arg]
+        self.rows.append(row)
+
+
+class _FakeConn:
+    def __init__(self) -> None:
+        self.calls: list = []  # type: ignore[type-arg]
+        self.stored: list = []  # type: ignore[type-arg]
+        self.commits = 0
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self.calls, self.stored)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+def test_upsert_rows_sends_multi_row_values_pages_on_psycopg3(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(kb_pgvector_ingest, "_DB_DRIVER", "psycopg")
+    monkeypatch.setattr(kb_pgvector_ingest, "psycopg", object())
+    df = pd.DataFrame(
+        [{"candidate_id": f"sku-{i % 4}", "brand": f"B{i}", "inci_list": "Aqua; Glycerin"} for i in range(5)]
+    )
+    rows = build_rows(df, dim=8)
+    conn = _FakeConn()
+
+    sent = kb_pgvector_ingest.upsert_rows(
+        conn, rows, schema="pci_kb", table="sku_ingredients", batch_size=3, skip_unchanged=False
+    )
+
+    assert sent == 4
+    assert conn.commits == 1
+    assert [len(params) for _sql, params in conn.calls] == [3 * 19, 1 * 19]
+    first_sql = conn.calls[0][0]
+    assert "VALUES %s" not in first_sql
+    assert first_sql.count("::vector") == 3
+    assert "IS DISTINCT FROM" not in first_sql
+    sku_keys = [params[i] for _sql, params in conn.calls for i in range(0, len(params), 19)]
+    assert sku_keys == ["sku-0", "sku-1", "sku-2", "sku-3"]
+    # The duplicate key keeps its last row.
+    assert conn.calls[0][1][2] == "B4"
+
+
+def test_build_rows_in_worker_processes_preserves_row_order(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(kb_pgvector_ingest, "_PARALLEL_MIN_ROWS", 1)
+    df = pd.DataFrame(
+        [
+            {"candidate_id": f"sku-{i}", "market": "US", "raw_ingredient_text": f"Water, Glycerin, Extract {i % 3}"}
+            for i in range(7)
+        ]
+    )
+
+    serial = build_rows(df, dim=16)
+    parallel = build_rows(df, dim=16, workers=3)
+    assert parallel == serial
+    assert [r.sku_key for r in parallel] == [f"sku-{i}" for i in range(7)]
+
+
+def test_build_rows_reuses_a_shared_pool(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(kb_pgvector_ingest, "_PARALLEL_MIN_ROWS", 1)
+    df = pd.DataFrame([{"candidate_id": f"sku-{i}", "raw_ingredient_text": "Water, Glycerin"} for i in range(4)])
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = build_rows(df, dim=16, workers=2, pool=pool)
+        second = build_rows(df, dim=16, workers=2, pool=pool)
+    assert first == second == build_rows(df, dim=16)
+
+
+def test_read_ingest_csv_keeps_known_columns_as_text(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    src = tmp_path / "kb.csv"
+    src.write_text("candidate_id,notes,ingest_allowed,parse_confidence,inci_list\n00123,x,True,0.5,Aqua\n,y,,,\n")
+
+    df = read_ingest_csv(str(src))
+
+    assert list(df.columns) == ["candidate_id", "ingest_allowed", "parse_confidence", "inci_list"]
+    assert df.iloc[0].tolist()[1:] == ["True", "0.5", "Aqua"]
+    assert df.iloc[1].isna().all()
+
+
+def test_ingest_csv_keeps_legacy_sku_keys_for_numeric_ids(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    src = tmp_path / "kb.csv"
+    src.write_text("row_id,raw_ingredient_text\n00123,Aqua\n7,Aqua\n,Aqua\n")
+
+    whole = build_rows(read_ingest_csv(str(src)), dim=8)
+    streamed = [r for df in iter_ingest_csv(str(src), chunk_rows=1) for r in build_rows(df, dim=8)]
+
+    assert [r.sku_key for r in whole] == ["123.0", "7.0"]
+    assert streamed == whole
+
+
+class _VersionCursor(_FakeCursor):
+    def __init__(self, calls: list, extversion: str) -> None:  # type: ignore[type-arg]
+        super().__init__(calls)
+        self.extversion = extversion
+
+    def fetchone(self) -> tuple:  # type: ignore[type-arg]
+        return (self.extversion,)
+
+
+def test_init_schema_picks_vector_index_by_pgvector_version() -> None:
+    def index_ddl(extversion: str) -> list[str]:
+        conn = _FakeConn()
+        conn.cursor = lambda: _VersionCursor(conn.calls, extversion)  # type: ignore[method-assign]
+        conn.rollback = lambda: None  # type: ignore[attr-defined]
+        kb_pgvector_ingest.init_schema(conn, schema="pci_kb", table="sku_ingredients", dim=8, create_index=True)
+        return [sql for sql, _params in conn.calls if "_embedding_" in sql]
+
+    hnsw = index_ddl("0.7.4")
+    assert len(hnsw) == 1 and "USING hnsw" in hnsw[0] and "ef_construction = 64" in hnsw[0]
+    ivfflat = index_ddl("0.4.4")
+    assert len(ivfflat) == 1 and "USING ivfflat" in ivfflat[0]
+
+
+def test_halfvec_storage_casts_upserts_and_index_ops(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(kb_pgvector_ingest, "_DB_DRIVER", "psycopg")
+    monkeypatch.setattr(kb_pgvector_ingest, "psycopg", object())
+    conn = _FakeConn()
+    conn.cursor = lambda: _VersionCursor(conn.calls, "0.7.4")  # type: ignore[method-assign]
+    kb_pgvector_ingest.init_schema(
+        conn, schema="pci_kb", table="sku_ingredients", dim=8, create_index=True, vector_type="halfvec"
+    )
+    rows = build_rows(pd.DataFrame([{"candidate_id": "sku-1", "inci_list": "Aqua"}]), dim=8)
+    kb_pgvector_ingest.upsert_rows(
+        conn, rows, schema="pci_kb", table="sku_ingredients", batch_size=10, vector_type="halfvec"
+    )
+
+    sqls = [sql for sql, _params in conn.calls]
+    assert any("embedding halfvec(8)" in sql for sql in sqls)
+    assert any("halfvec_cosine_ops" in sql for sql in sqls)
+    assert "::halfvec" in sqls[-1] and "::vector" not in sqls[-1]
+
+
+def test_main_streams_csv_chunks_into_upserts(monkeypatch, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(kb_pgvector_ingest, "_DB_DRIVER", "psycopg")
+    monkeypatch.setattr(kb_pgvector_ingest, "psycopg", object())
+    src = tmp_path / "kb.csv"
+    pd.DataFrame(
+        [{"candidate_id": f"sku-{i % 4}", "brand": f"B{i}", "inci_list": "Aqua; Glycerin"} for i in range(7)]
+    ).to_csv(src, index=False)
+
+    def upserted(chunk_rows: int) -> dict[str, str]:
+        conn = _FakeConn()
+        conn.cursor = lambda: _VersionCursor(conn.calls, "0.7.4")  # type: ignore[method-assign]
+        conn.close = lambda: None  # type: ignore[attr-defined]
+        monkeypatch.setattr(kb_pgvector_ingest, "_connect", lambda _url: conn)
+        argv = ["--csv", str(src), "--db-url", "postgresql://kb", "--dim", "8", "--chunk-rows", str(chunk_rows)]
+        assert kb_pgvector_ingest.main(argv) == 0
+        final: dict[str, str] = {}
+        for sql, params in conn.calls:
+            if sql.lstrip().startswith("INSERT"):
+                for i in range(0, len(params), 19):
+                    final[params[i]] = params[i + 2]
+        return final
+
+    whole = upserted(0)
+    assert whole == {"sku-0": "B4", "sku-1": "B5", "sku-2": "B6", "sku-3": "B3"}
+    assert upserted(3) == whole
+
+
+def test_main_reads_the_csv_before_connecting(monkeypatch, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    def fail_connect(_url: str) -> None:
+        raise AssertionError("connected before the CSV was read")
+
+    monkeypatch.setattr(kb_pgvector_ingest, "_connect", fail_connect)
+    with pytest.raises(FileNotFoundError):
+        kb_pgvector_ingest.main(["--csv", str(tmp_path / "missing.csv"), "--db-url", "postgresql://kb"])
+
+
+def test_main_init_only_prints_counts_and_writes_no_rows(monkeypatch, tmp_path, capsys) -> None:  # type: ignore[no-untyped-def]
+    src = tmp_path / "kb.csv"
+    pd.DataFrame([{"candidate_id": f"sku-{i}", "inci_list": "Aqua"} for i in range(3)]).to_csv(src, index=False)
+    conn = _FakeConn()
+    conn.cursor = lambda: _VersionCursor(conn.calls, "0.7.4")  # type: ignore[method-assign]
+    conn.close = lambda: None  # type: ignore[attr-defined]
+    monkeypatch.setattr(kb_pgvector_ingest, "_connect", lambda _url: conn)
+
+    argv = ["--csv", str(src), "--db-url", "postgresql://kb", "--dim", "8", "--init-only"]
+    assert kb_pgvector_ingest.main(argv) == 0
+
+    err = capsys.readouterr().err
+    assert "rows_total=3 rows_ingest=3 rows_written=0" in err
+    assert err.rstrip().endswith("INIT_OK")
+    assert conn.calls and not any(sql.lstrip().startswith("INSERT") for sql, _params in conn.calls)
+
+
+def test_upsert_rows_skips_rows_whose_content_sha_is_stored(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(kb_pgvector_ingest, "_DB_DRIVER", "psycopg")
+    monkeypatch.setattr(kb_pgvector_ingest, "psycopg", object())
+    rows = build_rows(pd.DataFrame([{"candidate_id": f"sku-{i}", "inci_list": "Aqua"} for i in range(3)]), dim=8)
+
+    first = _FakeConn()
+    kb_pgvector_ingest.upsert_rows(first, rows, schema="pci_kb", table="sku_ingredients", batch_size=10)
+    insert_sql, params = first.calls[-1]
+    assert "content_sha IS DISTINCT FROM EXCLUDED.content_sha" in insert_sql
+    shas = {params[i]: params[i + 18] for i in range(0, len(params), 19)}
+
+    again = _FakeConn()
+    again.stored.extend([("sku-0", memoryview(shas["sku-0"])), ("sku-1", b"stale")])
+    sent = kb_pgvector_ingest.upsert_rows(again, rows, schema="pci_kb", table="sku_ingredients", batch_size=10)
+    assert sent == 2
+    assert again.calls[0][1] == [["sku-0", "sku-1", "sku-2"]]
+    assert [p for p in again.calls[-1][1] if isinstance(p, str) and p.startswith("sku-")] == ["sku-1", "sku-2"]
+
+    unchanged = _FakeConn()
+    unchanged.stored.extend((key, sha) for key, sha in shas.items())
+    assert kb_pgvector_ingest.upsert_rows(unchanged, rows, schema="pci_kb", table="sku_ingredients", batch_size=10) == 0
+    assert len(unchanged.calls) == 1 and unchanged.commits == 1
+
+
+def test_upsert_rows_copy_mode_merges_through_a_staging_table(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(kb_pgvector_ingest, "_DB_DRIVER", "psycopg")
+    monkeypatch.setattr(kb_pgvector_ingest, "psycopg", object())
+    rows = build_rows(pd.DataFrame([{"candidate_id": f"sku-{i}", "inci_list": "Aqua"} for i in range(3)]), dim=8)
+
+    values_conn, copy_conn = _FakeConn(), _FakeConn()
+    kb_pgvector_ingest.upsert_rows(values_conn, rows, schema="pci_kb", table="sku_ingredients", batch_size=10)
+    sent = kb_pgvector_ingest.upsert_rows(
+        copy_conn, rows, schema="pci_kb", table="sku_ingredients", batch_size=10, use_copy=True
+    )
+
+    assert sent == 3
+    _select, create, (copy_sql, copied), (merge_sql, _params) = copy_conn.calls
+    assert "CREATE TEMP TABLE IF NOT EXISTS sku_ingredients_stage (LIKE pci_kb.sku_ingredients" in create[0]
+    assert copy_sql.startswith("COPY sku_ingredients_stage (sku_key,") and "embedding, content_sha)" in copy_sql
+    assert "FROM sku_ingredients_stage WHERE true" in merge_sql and "ON CONFLICT (sku_key)" in merge_sql
+    flat = [v for row in copied for v in row]
+    assert flat == values_conn.calls[-1][1]
+    assert copy_conn.commits == 1
@@ -41,3 +41,33 @@ def test_parser_runtime_strips_full_ingredients_list_prefix(tmp_path: Path) -> N
     assert snapshot["parse_status"] == "OK"
     assert snapshot["cleaned_text"].startswith("Aqua/Water/Eau, Glycerin")
     assert snapshot["inci_list_json"][0]["standard_name"] == "Aqua"
+
+
+def test_build_parser_snapshots_matches_single_snapshots_and_dedups(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    from app import parser_runtime
+
+    texts = ["Water, Glycerin", None, "Water, Glycerin", "Aqua/Water/Eau, Niacinamide"]
+    expected = [parser_runtime.build_parser_snapshot(text) for text in texts]
+
+    engine = parser_runtime.require_parser()
+    calls = []
+    original_parse = engine.parse_cleaned
+
+    def counting_parse(clean, noise_notes):  # type: ignore[no-untyped-def]
+        calls.append(clean)
+        return original_parse(clean, noise_notes)
+
+    monkeypatch.setattr(engine, "parse_cleaned", counting_parse)
+    snapshots = parser_runtime.build_parser_snapshots(texts)
+
+    assert snapshots == expected
+    assert len(calls) == 3
+
+
+def test_parser_response_list_fields_stay_arrays_without_schema_defaults() -> None:
+    from app.schema import ParserReparseResponse
+
+    resp = ParserReparseResponse(cleaned_text="", parse_status="NEEDS_SOURCE", inci_list="", parse_confidence=0.0)
+    assert resp.model_dump(mode="json")["needs_review"] == []
+    prop = ParserReparseResponse.model_json_schema()["properties"]["needs_review"]
+    assert prop["type"] == "array" and "default" not in prop
@@ -123,7 +123,10 @@ def test_harvester_searches_official_domains_before_generic_results(monkeypatch)
     out = h.process(market="US", brand="Dermalogica", product_name="smart response serum")
     assert out.status == "OK"
     assert out.source_ref == "https://dermalogica.com/products/smart-response-serum"
-    assert calls[0] == "https://dermalogica.com/products/smart-response-serum"
+    # Fetches within a group run concurrently, but results are walked in input order: official first.
+    assert "https://dermalogica.com/products/smart-response-serum" in calls
+    assert out.debug["urls"][0] == "https://dermalogica.com/products/smart-response-serum"
+    assert [a["url"] for a in out.debug["attempts"]] == ["https://dermalogica.com/products/smart-response-serum"]
 
 
 def test_harvester_returns_preferred_pending_when_search_fails(monkeypatch) -> None:
@@ -152,6 +155,26 @@ def test_harvester_returns_preferred_pending_when_search_fails(monkeypatch) -> N
     assert out.source_ref == "https://pixibeauty.com/products/on-the-glow-base"
 
 
+def test_harvester_records_fetch_errors_per_url(monkeypatch) -> None:
+    from app.harvester import fetch as fetch_mod
+    from app.harvester import source_harvester as sh_mod
+
+    html_good = "<html><body><h2>Ingredients</h2><div>Water, Glycerin, Sodium Chloride, Fragrance.</div></body></html>"
+
+    def fake_fetch(url: str):
+        if "down" in url:
+            raise RuntimeError("connection reset")
+        return fetch_mod.FetchResult(url=url, status_code=200, html=html_good, content_type="text/html")
+
+    monkeypatch.setattr(sh_mod, "fetch_html", fake_fetch)
+
+    h = SourceHarvester(search_engine=FakeSearch(urls=["https://example.com/down", "https://example.com/good"]))
+    out = h.process(market="US", brand="Test", product_name="P1")
+    assert out.status == "OK"
+    assert out.source_ref == "https://example.com/good"
+    assert {"url": "https://example.com/down", "error": "connection reset"} in out.debug["attempts"]
+
+
 def test_classify_source_type_marks_retailers_and_third_party_domains() -> None:
     assert classify_source_type("https://www.strawberrynet.com/en/ole-henriksen/product") == "Retailer"
     assert classify_source_type("https://incidecoder.com/products/dermalogica-smart-response-serum") == "ThirdParty"
@@ -21,11 +21,15 @@ Output : same CSV with appended columns:
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import multiprocessing
+import multiprocessing.pool
+import os
 import re
 import sys
-from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, BinaryIO, Iterator, Optional
 
 import pandas as pd
 
@@ -205,6 +209,7 @@ NEW_COLUMNS = [
     "needs_review",
 ]
 _NEW_COLUMNS_LOWER = {c.lower() for c in NEW_COLUMNS}
+_NEEDS_SOURCE_ROW = ("NEEDS_SOURCE", "", "[]", "[]", "[]", 0.0, "[]")
 
 
 INVALID_EXACT = {"n/a", "na", "none", "null", "nan"}
@@ -238,6 +243,20 @@ _BRACKET_MORE_LESS_RE = re.compile(r"\[\s*(?:more|less)\s*\]", re.IGNORECASE)
 _ELLIPSIS_RE = re.compile(r"\.{3,}|…+")
 _TRUNCATION_END_RE = re.compile(r"(?:\b(?:and|&)\b\s*(?:\.{3,}|…)?\s*$|\betc\.?\s*$)", re.IGNORECASE)
 
+# Token-level helpers; compiled once since they fire several times per token.
+_WS_RE = re.compile(r"\s+")
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_ANGLE_RE = re.compile(r"<[^>]{1,80}>")
+_PARENS_RE = re.compile(r"\([^)]*\)")
+_TM_RE = re.compile(r"[\u00ae\u2122]")  # ® ™
+_LOOKUP_KEY_TABLE = str.maketrans(
+    {"’": "'", "‘": "'", "（": "(", "）": ")", "/": " ", ".": " ", ":": " ", "：": " "}
+)
+_SLASH_DELIM_RE = re.compile(r"\s/\s")
+_WORDISH_RE = re.compile(r"[A-Za-z0-9]+")
+_UPPER_OR_DIGIT_RE = re.compile(r"[A-Z0-9]")
+_HYPHEN_OR_SLASH_RE = re.compile(r"[-/]")
+
 # Keep this list short and high-signal; avoid removing common ingredient words.
 _UI_ARTIFACT_PHRASES_RE = re.compile(
     r"("
@@ -256,6 +275,46 @@ _UI_ARTIFACT_PHRASES_RE = re.compile(
 )
 
 
+_EMPTY_TEXT_MARKERS = ("nan", "none", "null", "n/a", "na")
+_ZERO_WIDTH_RE = re.compile(r"[\u200b\u200c\u200d\ufeff]")
+_ZERO_WIDTH_TABLE = str.maketrans("", "", "\u200b\u200c\u200d\ufeff")
+
+# Cheap necessary conditions for each clean_noise pass: when a guard says no, the pattern cannot
+# match, so the full regex scan is skipped.
+_UI_ARTIFACT_LEAD_WORDS = ("read", "show", "see", "view", "click", "ingredient", "how")
+_TRUNCATION_TAIL_CHARS = frozenset("…&dDcC")
+_IGNORECASE_ASCII_FOLDS = ("\u0130", "\u0131", "\u017f", "\u212a")  # İ ı ſ K(elvin)
+
+
+def _may_have_ui_phrase(s: str) -> bool:
+    # IGNORECASE also matches these non-ASCII letters against ASCII i/s/k; let the regex decide.
+    if not s.isascii() and any(ch in s for ch in _IGNORECASE_ASCII_FOLDS):
+        return True
+    low = s.lower()
+    return any(word in low for word in _UI_ARTIFACT_LEAD_WORDS)
+
+
+def _may_have_truncation(s: str) -> bool:
+    t = s.rstrip()
+    if t.endswith("."):
+        return t.endswith("...") or t[-4:].lower() == "etc."
+    return t[-1:] in _TRUNCATION_TAIL_CHARS
+
+
+# clean_noise's substitution passes after zero-width removal, in order: (guard, pattern, replacement, note).
+# Order matters: earlier removals can expose later matches (e.g. a trailing "and" behind an ellipsis).
+_NOISE_PASSES = (
+    (lambda s: "://" in s, _URL_RE, " ", "Stripped URL(s)"),
+    (lambda s: "#" in s, _HASHTAG_RE, r"\1", "Removed marketing hashtag(s)"),  # keep the separator in group 1
+    (lambda s: "[" in s, _BRACKET_MORE_LESS_RE, " ", "Removed UI bracket token(s)"),
+    (_may_have_ui_phrase, _UI_ARTIFACT_PHRASES_RE, " ", "Removed UI phrase(s)"),
+    (_may_have_truncation, _TRUNCATION_END_RE, "", "Removed truncation ending"),
+    (lambda s: "..." in s or "…" in s, _ELLIPSIS_RE, " ", "Removed ellipsis artifact(s)"),
+    # Re-run truncation fix in case ellipsis normalization revealed a trailing conjunction.
+    (_may_have_truncation, _TRUNCATION_END_RE, "", "Removed truncation ending"),
+)
+
+
 def clean_noise(text: str) -> tuple[str, list[str]]:
     """
     Remove common crawler noise without inventing new ingredients.
@@ -272,67 +331,39 @@ def clean_noise(text: str) -> tuple[str, list[str]]:
     notes: list[str] = []
 
     # Remove zero-width spaces that frequently appear in scraped HTML.
-    if any(ch in s for ch in ["\u200b", "\u200c", "\u200d", "\ufeff"]):
-        s = s.replace("\u200b", "").replace("\u200c", "").replace("\u200d", "").replace("\ufeff", "")
-        notes.append("Removed zero-width spaces")
-
-    # Strip URLs.
-    s2 = _URL_RE.sub(" ", s)
+    s2 = s.translate(_ZERO_WIDTH_TABLE)
     if s2 != s:
-        notes.append("Stripped URL(s)")
-        s = s2
-
-    # Remove marketing tags like "#vegan".
-    s2 = _HASHTAG_RE.sub(r"\1", s)
-    if s2 != s:
-        notes.append("Removed marketing hashtag(s)")
-        s = s2
-
-    # Remove bracket artifacts like "[more]".
-    s2 = _BRACKET_MORE_LESS_RE.sub(" ", s)
-    if s2 != s:
-        notes.append("Removed UI bracket token(s)")
-        s = s2
-
-    # Remove common UI phrases.
-    s2 = _UI_ARTIFACT_PHRASES_RE.sub(" ", s)
-    if s2 != s:
-        notes.append("Removed UI phrase(s)")
-        s = s2
-
-    # Fix common truncation endings.
-    s2 = _TRUNCATION_END_RE.sub("", s)
-    if s2 != s:
-        notes.append("Removed truncation ending")
-        s = s2
-
-    # Normalize ellipsis.
-    s2 = _ELLIPSIS_RE.sub(" ", s)
-    if s2 != s:
-        notes.append("Removed ellipsis artifact(s)")
+        notes.append("Removed zero-width spaces")
         s = s2
 
-    # Re-run truncation fix in case ellipsis normalization revealed a trailing conjunction.
-    s2 = _TRUNCATION_END_RE.sub("", s)
-    if s2 != s:
-        notes.append("Removed truncation ending")
-        s = s2
+    # URLs, hashtags, UI brackets/phrases, truncation endings and ellipses (see _NOISE_PASSES).
+    for guard, pattern, repl, note in _NOISE_PASSES:
+        if not guard(s):
+            continue
+        s2 = pattern.sub(repl, s)
+        if s2 != s:
+            notes.append(note)
+            s = s2
 
-    # Final whitespace/punctuation normalization.
-    s = re.sub(r"\s+", " ", s).strip()
+    # Final whitespace/punctuation normalization (split/join collapses the same whitespace as \s+).
+    s = " ".join(s.split())
     s = s.strip().strip("。．. ;；,，")
     return s, notes
 
 
 def _coerce_text(value: Any) -> str:
-    if value is None:
+    if isinstance(value, str):
+        # Most cells are already text; pd.isna is never true for a str.
+        s = value.strip()
+    elif value is None:
         return ""
-    try:
-        if pd.isna(value):
-            return ""
-    except Exception:  # noqa: BLE001
-        pass
-    s = str(value).strip()
+    else:
+        try:
+            if pd.isna(value):
+                return ""
+        except Exception:  # noqa: BLE001
+            pass
+        s = str(value).strip()
     if not s:
         return ""
     if s.strip().lower() in {"nan", "none", "null", "n/a", "na"}:
@@ -341,7 +372,7 @@ def _coerce_text(value: Any) -> str:
 
 
 def _contains_cjk(s: str) -> bool:
-    return bool(re.search(r"[\u4e00-\u9fff]", s or ""))
+    return bool(_CJK_RE.search(s or ""))
 
 
 def _strip_angle_brackets(s: str) -> tuple[str, list[str]]:
@@ -351,7 +382,7 @@ def _strip_angle_brackets(s: str) -> tuple[str, list[str]]:
         removed.append(m.group(0))
         return ""
 
-    out = re.sub(r"<[^>]{1,80}>", _repl, s or "")
+    out = _ANGLE_RE.sub(_repl, s or "")
     return out.strip(), removed
 
 
@@ -362,8 +393,12 @@ def _preprocess(raw: str) -> str:
     # Remove trailing punctuation noise.
     s = s.strip().strip("。．. ;；,，")
     # Normalize whitespace/newlines.
-    s = re.sub(r"\s+", " ", s)
-    return s.strip()
+    return " ".join(s.split())
+
+
+def _clean_and_preprocess(raw: str) -> tuple[str, list[str]]:
+    """`_preprocess` then `clean_noise`: the (text, noise notes) pair `ParserEngine.parse_cleaned` expects."""
+    return clean_noise(_preprocess(raw))
 
 
 def _looks_invalid_blob(text: str) -> bool:
@@ -380,13 +415,25 @@ def _looks_invalid_blob(text: str) -> bool:
     return False
 
 
-def _split_outside_parens(text: str, separators: set[str]) -> list[str]:
+@lru_cache(maxsize=None)
+def _separator_table(separators: frozenset[str]) -> tuple[dict[int, str], str]:
+    # Fold every separator onto one of them so a plain str.split() does the work.
+    sep = min(separators)
+    return str.maketrans(dict.fromkeys(separators, sep)), sep
+
+
+def _split_outside_parens(text: str, separators: frozenset[str]) -> list[str]:
+    if not _PAREN_OPENER_RE.search(text):
+        # No opener means depth never leaves 0, so every separator splits.
+        table, sep = _separator_table(separators)
+        return [token for token in (part.strip() for part in text.translate(table).split(sep)) if token]
+
     tokens: list[str] = []
     buf: list[str] = []
     depth = 0
 
-    openers = {"(", "（", "[", "【", "{"}
-    closers = {")", "）", "]", "】", "}"}
+    openers = _PAREN_OPENERS
+    closers = _PAREN_CLOSERS
 
     for ch in text:
         if ch in openers:
@@ -413,11 +460,18 @@ def _split_outside_parens(text: str, separators: set[str]) -> list[str]:
     return tokens
 
 
+_TOKEN_SEPARATORS = frozenset({",", "，", "、", ";", "；", "\n", "\r", "\t", "|", "•", "·", "●", "・"})
+_PAREN_OPENERS = frozenset({"(", "（", "[", "【", "{"})
+_PAREN_CLOSERS = frozenset({")", "）", "]", "】", "}"})
+_PAREN_OPENER_RE = re.compile(r"[(（\[【{]")
+_SLASH_SEPARATORS = frozenset({"/"})
+
+
 def _split_ingredients(clean_text: str) -> tuple[list[str], bool]:
     """
     Returns (tokens, separator_detection_failed)
     """
-    separators = {",", "，", "、", ";", "；", "\n", "\r", "\t", "|", "•", "·", "●", "・"}
+    separators = _TOKEN_SEPARATORS
     t = (clean_text or "").strip()
     if not t:
         return [], False
@@ -425,15 +479,15 @@ def _split_ingredients(clean_text: str) -> tuple[list[str], bool]:
     tokens = _split_outside_parens(t, separators)
 
     # Secondary split: " / " (only when used as a delimiter, not for Caprylic/Capric).
-    if len(tokens) == 1 and re.search(r"\s/\s", tokens[0]):
-        tokens = _split_outside_parens(tokens[0], {"/"})
+    if len(tokens) == 1 and _SLASH_DELIM_RE.search(tokens[0]):
+        tokens = _split_outside_parens(tokens[0], _SLASH_SEPARATORS)
 
     normalized: list[str] = []
     for tok in tokens:
         s = (tok or "").strip()
         s = s.strip(" \t\n\r-–—•·●・")
         s = s.strip().strip("。．. ;；,，")
-        s = re.sub(r"\s+", " ", s).strip()
+        s = " ".join(s.split())
         if s:
             normalized.append(s)
 
@@ -441,7 +495,7 @@ def _split_ingredients(clean_text: str) -> tuple[list[str], bool]:
     # (e.g. "Aqua Glycerin Niacinamide ..." without commas)
     if len(normalized) == 1:
         blob = normalized[0]
-        wordish = re.findall(r"[A-Za-z0-9]+", blob)
+        wordish = _WORDISH_RE.findall(blob)
         sep_failed = len(blob) >= 80 or len(wordish) >= 6
     else:
         sep_failed = False
@@ -450,17 +504,17 @@ def _split_ingredients(clean_text: str) -> tuple[list[str], bool]:
 
 def _normalize_lookup_key(text: str) -> str:
     s = (text or "").strip().lower()
-    s = s.replace("’", "'").replace("‘", "'")
-    s = s.replace("（", "(").replace("）", ")")
-    s = re.sub(r"<[^>]{1,80}>", "", s)
+    # Quote/full-width paren folding and "/", [.:：] -> space in one pass. The space mappings are
+    # 1:1 and never produce `<`, `>`, `(` or `)`, so tag/parenthetical removal still sees the same spans.
+    s = s.translate(_LOOKUP_KEY_TABLE)
+    if "<" in s:
+        s = _ANGLE_RE.sub("", s)
     # Remove parenthetical content for matching (e.g., "Fragrance (parfum)").
-    s = re.sub(r"\([^)]*\)", "", s)
-    # Normalize punctuation / spacing for matching.
-    s = s.replace("/", " ")
-    s = re.sub(r"[\u00ae\u2122]", "", s)  # ® ™
-    s = re.sub(r"[.:：]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    if "(" in s:
+        s = _PARENS_RE.sub("", s)
+    if "\u00ae" in s or "\u2122" in s:
+        s = _TM_RE.sub("", s)
+    return " ".join(s.split())
 
 
 def _canonicalize_unknown_english(token: str) -> str:
@@ -468,78 +522,153 @@ def _canonicalize_unknown_english(token: str) -> str:
     if not t:
         return ""
     # If token already contains uppercase/digits/symbols, keep as-is (avoid PEG -> Peg).
-    if re.search(r"[A-Z0-9]", t) or re.search(r"[-/]", t):
+    if _UPPER_OR_DIGIT_RE.search(t) or _HYPHEN_OR_SLASH_RE.search(t):
         return t[:1].upper() + t[1:]
     return " ".join(w[:1].upper() + w[1:] for w in t.split())
 
 
-def _append_unique(items: list[Any], value: Any) -> None:
-    if value in items:
-        return
-    items.append(value)
+def _build_lookup_tables(raw_map: dict[str, str]) -> tuple[dict[str, str], dict[str, str], frozenset[str]]:
+    norm_map: dict[str, str] = {}
+    for k, v in raw_map.items():
+        nk = _normalize_lookup_key(k)
+        if not nk:
+            continue
+        # Keep the first mapping if duplicates exist.
+        norm_map.setdefault(nk, v)
+    # Normalized form of each standard name, so a hit doesn't re-normalize the target per token.
+    standard_keys = {v: _normalize_lookup_key(v) for v in set(norm_map.values())}
+    # Keys that normalize to themselves: a token whose stripped lowercase form is one of these
+    # would normalize to it as well, so it can skip the regex passes.
+    exact_keys = frozenset(k for k in norm_map if _normalize_lookup_key(k) == k)
+    return norm_map, standard_keys, exact_keys
+
+
+# Built once at import; every default engine (including pool workers) shares these read-only tables.
+_DEFAULT_LOOKUP_TABLES = _build_lookup_tables(COMMON_INGREDIENTS_DB)
 
 
-@dataclass
-class ParsedIngredient:
-    order: int
-    standard_name: str
-    original_text: str
-    uncertain: bool = False
-    needs_review: bool = False
+def _ingredient_entry(order: int, standard: str, original: str, uncertain: bool, needs_review: bool) -> dict[str, Any]:
+    return {
+        "order": order,
+        "standard_name": standard,
+        "original_text": original,
+        "uncertain": uncertain,
+        "needs_review": needs_review,
+    }
 
 
 class ParserEngine:
     def __init__(self, mapping: Optional[dict[str, str]] = None) -> None:
-        raw_map = mapping or COMMON_INGREDIENTS_DB
-        norm_map: dict[str, str] = {}
-        for k, v in raw_map.items():
-            nk = _normalize_lookup_key(k)
-            if not nk:
+        if mapping:
+            self._map, self._standard_keys, self._exact_keys = _build_lookup_tables(mapping)
+        else:
+            self._map, self._standard_keys, self._exact_keys = _DEFAULT_LOOKUP_TABLES
+        # Bulk files repeat the same few hundred tokens; memoize the normalize+lookup per engine.
+        self._lookup = lru_cache(maxsize=65536)(self._lookup_token)
+        # Whole ingredient lists repeat across shade/size variants; memoize per cleaned text too.
+        self._parse_cached = lru_cache(maxsize=8192)(self._parse_row_uncached)
+
+    def _lookup_token(self, tok: str) -> tuple[Optional[str], bool]:
+        """Return (standard_name or None, whether the mapping changes the normalized text)."""
+        key = tok.strip().lower()
+        if key not in self._exact_keys:
+            key = _normalize_lookup_key(tok)
+        mapped = self._map.get(key)
+        if not mapped:
+            return None, False
+        return mapped, self._standard_keys[mapped] != key
+
+    @staticmethod
+    def preclean_series(values: pd.Series) -> tuple[list[str], list[list[str]]]:
+        """
+        Column-wise equivalent of `_coerce_text` -> `_preprocess` -> `clean_noise`.
+
+        Each pass runs once over the column's distinct texts (catalogs repeat the same list across
+        shades/sizes) and results are broadcast back. Notes follow `clean_noise`'s order; rows with
+        identical text share one notes list, so treat them as read-only.
+        """
+        text = values.astype(object).where(values.notna(), "").astype(str).str.strip()
+        text = text.mask(text.str.lower().isin(_EMPTY_TEXT_MARKERS), "")
+        codes, uniques = pd.factorize(text, sort=False)
+        text = pd.Series(uniques, dtype=object)
+
+        # _preprocess
+        text = text.str.replace(LABEL_PREFIX_RE, "", regex=True)
+        text = text.str.replace(LABEL_PREFIX_ZH_RE, "", regex=True)
+        text = text.str.strip().str.strip("。．. ;；,，")
+        text = text.str.replace(_WS_RE, " ", regex=True).str.strip()
+
+        # clean_noise
+        notes: list[list[str]] = [[] for _ in range(len(text))]
+
+        def _record(changed: pd.Series, note: str) -> None:
+            for i in changed.to_numpy().nonzero()[0]:
+                notes[i].append(note)
+
+        has_zero_width = text.str.contains(_ZERO_WIDTH_RE, regex=True)
+        if has_zero_width.any():
+            text = text.str.translate(_ZERO_WIDTH_TABLE)
+            _record(has_zero_width, "Removed zero-width spaces")
+        for guard, pattern, repl, note in _NOISE_PASSES:
+            candidates = text.map(guard).astype(bool)
+            if not candidates.any():
                 continue
-            # Keep the first mapping if duplicates exist.
-            norm_map.setdefault(nk, v)
-        self._map = norm_map
+            before = text[candidates]
+            after = before.str.replace(pattern, repl, regex=True)
+            _record((after != before).reindex(text.index, fill_value=False), note)
+            text = text.copy()
+            text[candidates] = after
+        text = text.str.replace(_WS_RE, " ", regex=True).str.strip()
+        text = text.str.strip().str.strip("。．. ;；,，")
+
+        cleaned = text.tolist()
+        return [cleaned[c] for c in codes], [notes[c] for c in codes]
 
     def parse(self, raw_ingredient_text: Any) -> dict[str, Any]:
-        raw = _coerce_text(raw_ingredient_text)
-        clean = _preprocess(raw)
-        clean, noise_notes = clean_noise(clean)
+        clean, noise_notes = _clean_and_preprocess(_coerce_text(raw_ingredient_text))
+        return self.parse_cleaned(clean, noise_notes)
+
+    def parse_cleaned(self, clean: str, noise_notes: list[str]) -> dict[str, Any]:
+        """Parse text that already went through `_clean_and_preprocess`."""
+        return dict(zip(NEW_COLUMNS, self.parse_row(clean, noise_notes)))
 
+    def parse_row(self, clean: str, noise_notes: list[str]) -> tuple[Any, ...]:
+        """Like `parse_cleaned`, but returns the output values as a tuple in `NEW_COLUMNS` order."""
+        return self._parse_cached(clean, tuple(noise_notes))
+
+    def cache_info(self) -> dict[str, Any]:
+        """Hit/miss counters for the per-engine parse cache."""
+        info = self._parse_cached.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "hit_rate": (info.hits / lookups) if lookups else 0.0,
+        }
+
+    def _parse_row_uncached(self, clean: str, noise_notes: tuple[str, ...]) -> tuple[Any, ...]:
         if _looks_invalid_blob(clean):
-            return {
-                "parse_status": "NEEDS_SOURCE",
-                "inci_list": "",
-                "inci_list_json": "[]",
-                "unrecognized_tokens": "[]",
-                "normalization_notes": "[]",
-                "parse_confidence": 0.0,
-                "needs_review": "[]",
-            }
+            return _NEEDS_SOURCE_ROW
 
         tokens, sep_failed = _split_ingredients(clean)
         if not tokens:
-            return {
-                "parse_status": "NEEDS_SOURCE",
-                "inci_list": "",
-                "inci_list_json": "[]",
-                "unrecognized_tokens": "[]",
-                "normalization_notes": "[]",
-                "parse_confidence": 0.0,
-                "needs_review": "[]",
-            }
+            return _NEEDS_SOURCE_ROW
 
         confidence = 1.0
         if sep_failed:
             confidence -= 0.5
 
-        parsed: list[ParsedIngredient] = []
-        unrecognized: list[str] = []
+        # Build the JSON rows directly; a per-token record object would only be unpacked again below.
+        names: list[str] = []
+        entries: list[dict[str, Any]] = []
+        # Insertion-ordered set: O(1) de-dup instead of a linear `in` scan per unknown token.
+        unrecognized: dict[str, None] = {}
         notes: list[str] = []
         if noise_notes:
             notes.extend(noise_notes)
         review_items: list[dict[str, Any]] = []
 
-        order = 1
         for tok in tokens:
             token_before = tok
             tok, removed = _strip_angle_brackets(tok)
@@ -549,66 +678,85 @@ class ParserEngine:
             if not tok:
                 continue
 
-            key = _normalize_lookup_key(tok)
-            mapped = self._map.get(key)
+            mapped, remapped = self._lookup(tok)
 
             if mapped:
                 standard = mapped
                 # Only note when mapping changes meaningfully.
-                if _normalize_lookup_key(standard) != key:
+                if remapped:
                     notes.append(f"Mapped '{tok}' -> '{standard}'")
-                parsed.append(ParsedIngredient(order=order, standard_name=standard, original_text=tok))
-                order += 1
+                names.append(standard)
+                entries.append(_ingredient_entry(len(entries) + 1, standard, tok, False, False))
                 continue
 
             # Fallbacks
             if _contains_cjk(tok):
                 standard = tok
-                _append_unique(unrecognized, tok)
+                unrecognized[tok] = None
                 review_items.append({"original_text": tok, "issue": "No INCI mapping found"})
                 confidence -= 0.1
-                parsed.append(
-                    ParsedIngredient(
-                        order=order, standard_name=standard, original_text=tok, uncertain=True, needs_review=True
-                    )
-                )
-                order += 1
+                names.append(standard)
+                entries.append(_ingredient_entry(len(entries) + 1, standard, tok, True, True))
                 continue
 
             standard = _canonicalize_unknown_english(tok)
             if standard:
-                _append_unique(unrecognized, tok)
-                parsed.append(ParsedIngredient(order=order, standard_name=standard, original_text=tok, uncertain=True))
-                order += 1
+                unrecognized[tok] = None
+                names.append(standard)
+                entries.append(_ingredient_entry(len(entries) + 1, standard, tok, True, False))
 
         confidence = max(0.0, min(1.0, float(confidence)))
         parse_status = "NEEDS_REVIEW" if confidence < 0.6 else "OK"
 
-        inci_list = "; ".join(p.standard_name for p in parsed if p.standard_name)
-
-        inci_json = json.dumps(
-            [
-                {
-                    "order": p.order,
-                    "standard_name": p.standard_name,
-                    "original_text": p.original_text,
-                    "uncertain": p.uncertain,
-                    "needs_review": p.needs_review,
-                }
-                for p in parsed
-            ],
-            ensure_ascii=False,
+        inci_list = "; ".join(n for n in names if n)
+        inci_json = json.dumps(entries, ensure_ascii=False)
+
+        return (
+            parse_status,
+            inci_list,
+            inci_json,
+            json.dumps(list(unrecognized), ensure_ascii=False),
+            json.dumps(notes, ensure_ascii=False),
+            confidence,
+            json.dumps(review_items, ensure_ascii=False),
         )
 
-        return {
-            "parse_status": parse_status,
-            "inci_list": inci_list,
-            "inci_list_json": inci_json,
-            "unrecognized_tokens": json.dumps(unrecognized, ensure_ascii=False),
-            "normalization_notes": json.dumps(notes, ensure_ascii=False),
-            "parse_confidence": confidence,
-            "needs_review": json.dumps(review_items, ensure_ascii=False),
-        }
+
+# Below this many rows, process spawn + engine init costs more than parsing serially.
+_PARALLEL_MIN_ROWS = 2000
+_POOL_CHUNKSIZE = 1024
+
+_WORKER_ENGINE: Optional[ParserEngine] = None
+
+
+def _init_worker() -> None:
+    global _WORKER_ENGINE  # noqa: PLW0603
+    _WORKER_ENGINE = ParserEngine()
+
+
+def _parse_one(item: tuple[str, list[str]]) -> tuple[Any, ...]:
+    assert _WORKER_ENGINE is not None
+    return _WORKER_ENGINE.parse_row(item[0], item[1])
+
+
+def _start_pool(workers: int) -> Optional[multiprocessing.pool.Pool]:
+    """One worker pool for a whole run (0 = CPU count); None when parsing stays in-process."""
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    if workers <= 1:
+        return None
+    return multiprocessing.Pool(processes=workers, initializer=_init_worker)
+
+
+def _parse_all(
+    engine: ParserEngine,
+    cleaned: list[str],
+    noise_notes: list[list[str]],
+    pool: Optional[multiprocessing.pool.Pool] = None,
+) -> list[tuple[Any, ...]]:
+    if pool is None or len(cleaned) < _PARALLEL_MIN_ROWS:
+        return [engine.parse_row(c, n) for c, n in zip(cleaned, noise_notes)]
+    # parse_row is pure once the engine is built, so rows fan out freely; imap keeps input order.
+    return list(pool.imap(_parse_one, zip(cleaned, noise_notes), chunksize=_POOL_CHUNKSIZE))
 
 
 def _detect_raw_column(df: pd.DataFrame) -> str:
@@ -627,6 +775,59 @@ def _drop_existing_output_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df.drop(columns=existing)
 
 
+_JSON_COLUMNS = ("inci_list_json", "unrecognized_tokens", "normalization_notes", "needs_review")
+
+
+def _load_arrow_csv() -> Optional[tuple[Any, Any]]:
+    try:
+        import pyarrow as pa  # type: ignore[import-not-found]
+        import pyarrow.csv as pa_csv  # type: ignore[import-not-found]
+    except Exception:  # noqa: BLE001
+        print("[parser] pyarrow is not installed; writing with pandas", file=sys.stderr)
+        return None
+    return pa, pa_csv
+
+
+def _write_csv(out: pd.DataFrame, fh: BinaryIO, *, header: bool, arrow: Optional[tuple[Any, Any]]) -> None:
+    if arrow is not None:
+        pa, pa_csv = arrow
+        try:
+            table = pa.Table.from_pandas(out, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+            # Mixed-type object columns from the input can't become an Arrow column.
+            print(f"[parser] arrow writer unavailable for this input ({exc}); writing with pandas", file=sys.stderr)
+        else:
+            # JSON blobs can overflow 32-bit string offsets on large catalogs.
+            for name in _JSON_COLUMNS:
+                i = table.schema.get_field_index(name)
+                table = table.set_column(i, name, table.column(i).cast(pa.large_string()))
+            options = pa_csv.WriteOptions(include_header=header, quoting_style="needed")
+            pa_csv.write_csv(table, fh, write_options=options)
+            return
+    out.to_csv(fh, index=False, header=header)
+
+
+def _read_input_chunks(path: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    # Columns are read as text: pandas infers dtypes per chunk, so an int column with blanks in only some
+    # chunks would otherwise be written as 7 in one chunk and 7.0 in the next. Text passes cells through as-is.
+    with pd.read_csv(path, encoding="utf-8-sig", chunksize=chunk_rows, dtype=str) as reader:
+        yield from reader
+
+
+def _parse_chunk(engine: ParserEngine, df: pd.DataFrame, pool: Optional[multiprocessing.pool.Pool] = None) -> pd.DataFrame:
+    df = _drop_existing_output_columns(df)
+    raw_col = _detect_raw_column(df)
+    if raw_col not in df.columns:
+        # Keep behavior predictable even if the column is missing.
+        df[raw_col] = ""
+
+    cleaned, noise_notes = ParserEngine.preclean_series(df[raw_col])
+    parsed_rows = _parse_all(engine, cleaned, noise_notes, pool)
+    # Rows are plain tuples, so pandas skips per-row dict key matching; reuse the chunk's index so concat aligns.
+    parsed_df = pd.DataFrame(parsed_rows, columns=NEW_COLUMNS, index=df.index)
+    return pd.concat([df, parsed_df], axis=1)
+
+
 def _run_self_test() -> bool:
     engine = ParserEngine()
     cases: list[tuple[str, dict[str, Any]]] = [
@@ -699,6 +900,25 @@ def main(argv: Optional[list[str]] = None) -> int:
         default=10,
         help="Print first N parsed rows to stdout as CSV (default: 10). Set 0 to disable.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=f"Parser processes (default: 1; 0 = CPU count; chunks under {_PARALLEL_MIN_ROWS} rows parse serially).",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=1_000_000,
+        help="Rows read, parsed and written per chunk (default: 1000000).",
+    )
+    parser.add_argument(
+        "--writer",
+        choices=["pandas", "arrow"],
+        default="pandas",
+        help="CSV writer (default: pandas). 'arrow' encodes columns in C via pyarrow when installed; "
+        "booleans/nulls are spelled the Arrow way (true/false, empty).",
+    )
     parser.add_argument(
         "--self-test",
         action="store_true",
@@ -709,22 +929,7 @@ def main(argv: Optional[list[str]] = None) -> int:
     if args.self_test:
         return 0 if _run_self_test() else 1
 
-    try:
-        df = pd.read_csv(args.input, encoding="utf-8-sig")
-    except Exception:  # noqa: BLE001
-        df = pd.read_csv(args.input)
-    df = _drop_existing_output_columns(df)
-    raw_col = _detect_raw_column(df)
-    if raw_col not in df.columns:
-        # Keep behavior predictable even if the column is missing.
-        df[raw_col] = ""
-
-    engine = ParserEngine()
-    parsed_records = [engine.parse(v) for v in df[raw_col].tolist()]
-    parsed_df = pd.DataFrame(parsed_records, columns=NEW_COLUMNS)
-
-    out = pd.concat([df.reset_index(drop=True), parsed_df.reset_index(drop=True)], axis=1)
-
+    output_path = ""
     if not args.no_write:
         output_path = args.output.strip()
         if not output_path:
@@ -732,10 +937,30 @@ def main(argv: Optional[list[str]] = None) -> int:
                 output_path = f"{args.input[:-4]}.parsed.csv"
             else:
                 output_path = f"{args.input}.parsed.csv"
-        out.to_csv(output_path, index=False)
+    arrow = _load_arrow_csv() if (output_path and args.writer == "arrow") else None
+    demo_rows = max(0, int(args.demo_rows or 0))
 
-    if args.demo_rows and args.demo_rows > 0:
-        demo = out.head(int(args.demo_rows))
+    # Stream the input so peak memory is one chunk of input plus its parsed output, not the whole file twice.
+    # One worker pool serves every chunk, so workers build their lookup tables once per run.
+    engine = ParserEngine()
+    demo_parts: list[pd.DataFrame] = []
+    demo_count = 0
+    with _start_pool(args.workers) or contextlib.nullcontext() as pool, (
+        open(output_path, "wb") if output_path else contextlib.nullcontext()
+    ) as fh:
+        for i, chunk in enumerate(_read_input_chunks(args.input, max(1, int(args.chunk_rows)))):
+            if fh is None and i > 0 and demo_count >= demo_rows:
+                # Nothing left to write or show.
+                break
+            out = _parse_chunk(engine, chunk, pool)
+            if fh is not None:
+                _write_csv(out, fh, header=(i == 0), arrow=arrow)
+            if demo_count < demo_rows:
+                demo_parts.append(out.head(demo_rows - demo_count))
+                demo_count += len(demo_parts[-1])
+
+    if demo_rows > 0:
+        demo = pd.concat(demo_parts) if len(demo_parts) > 1 else demo_parts[0]
         demo.to_csv(sys.stdout, index=False)
 
     return 0
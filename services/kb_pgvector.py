@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import math
 import re
+from functools import lru_cache
+from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
 
 _TOKEN_RE = re.compile(r"[A-Za-z0-9]+(?:[-_'][A-Za-z0-9]+)*|[\u4e00-\u9fff]+")
 
@@ -13,7 +21,14 @@ def tokenize(text: str) -> list[str]:
     s = (text or "").strip().lower()
     if not s:
         return []
-    return [m.group(0) for m in _TOKEN_RE.finditer(s)]
+    # The pattern has no capturing groups, so findall returns whole matches without building Match objects.
+    return _TOKEN_RE.findall(s)
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(tok: str) -> int:
+    # 8 bytes is enough for stable index/sign.
+    return int.from_bytes(hashlib.blake2b(tok.encode("utf-8"), digest_size=8).digest(), "big", signed=False)
 
 
 def hash_embedding(text: str, *, dim: int = 384) -> list[float]:
@@ -31,10 +46,16 @@ def hash_embedding(text: str, *, dim: int = 384) -> list[float]:
     if not tokens:
         return vec
 
+    if np is not None:
+        arr = np.fromiter(map(_token_hash, tokens), dtype=np.uint64, count=len(tokens))
+        # bincount does the scatter-add in one C pass; cheaper than np.add.at at every token count we see.
+        acc = np.bincount((arr % dim).astype(np.intp), weights=2.0 * (arr & 1).astype(np.float64) - 1.0, minlength=dim)
+        # Bucket counts are small integers, so the norm and quotients match the scalar path bit for bit.
+        norm = float(np.linalg.norm(acc))
+        return (acc / norm).tolist() if norm > 0 else acc.tolist()
+
     for tok in tokens:
-        # 8 bytes is enough for stable index/sign.
-        h = hashlib.blake2b(tok.encode("utf-8"), digest_size=8).digest()
-        n = int.from_bytes(h, "big", signed=False)
+        n = _token_hash(tok)
         idx = int(n % dim)
         sign = 1.0 if (n & 1) == 1 else -1.0
         vec[idx] += sign
@@ -45,13 +66,106 @@ def hash_embedding(text: str, *, dim: int = 384) -> list[float]:
     return vec
 
 
+def _hash_embedding_matrix(texts: list[str], dim: int) -> "np.ndarray":
+    token_lists = list(map(tokenize, texts))
+    counts = np.fromiter(map(len, token_lists), dtype=np.intp, count=len(token_lists))
+    # map() over the flattened tokens keeps the per-token hash call in C; a generator re-enters a Python frame.
+    arr = np.fromiter(
+        map(_token_hash, itertools.chain.from_iterable(token_lists)),
+        dtype=np.uint64,
+        count=int(counts.sum()),
+    )
+    flat_idx = np.repeat(np.arange(len(token_lists), dtype=np.intp), counts) * dim + (arr % dim).astype(np.intp)
+    acc = np.bincount(flat_idx, weights=2.0 * (arr & 1).astype(np.float64) - 1.0, minlength=len(token_lists) * dim)
+    # bincount returns int64 when there are no tokens at all.
+    acc = acc.astype(np.float64, copy=False).reshape(len(token_lists), dim)
+    # Integer bucket counts: the squared sums are exact, so each row matches hash_embedding bit for bit.
+    norms = np.sqrt(np.einsum("ij,ij->i", acc, acc))[:, None]
+    np.divide(acc, norms, out=acc, where=norms > 0)
+    return acc
+
+
+def hash_embedding_batch(texts: list[str], *, dim: int = 384) -> list[list[float]]:
+    """
+    `hash_embedding` for many texts at once; returns the same vectors, in input order.
+
+    All tokens of the batch are hashed into one array and scattered with a single bincount over
+    (row, bucket), so the per-text NumPy call overhead is paid once per batch.
+    """
+    if dim <= 0:
+        raise ValueError("dim must be > 0")
+    if np is None:
+        return [hash_embedding(t, dim=dim) for t in texts]
+    return _hash_embedding_matrix(texts, dim).tolist()
+
+
+def embedding_literals(texts: list[str], *, dim: int = 384, max_decimals: int = 6) -> list[str]:
+    """`vector_literal(hash_embedding(t))` for each text, without materializing per-row float lists."""
+    if dim <= 0:
+        raise ValueError("dim must be > 0")
+    if np is None:
+        return [vector_literal(hash_embedding(t, dim=dim), max_decimals=max_decimals) for t in texts]
+    return vector_literals(_hash_embedding_matrix(texts, dim), max_decimals=max_decimals)
+
+
 def vector_literal(vec: list[float], *, max_decimals: int = 6) -> str:
     if not vec:
         return "[]"
-    fmt = f"{{:.{int(max_decimals)}f}}"
-    return "[" + ",".join(fmt.format(float(v)) for v in vec) + "]"
+    fmt = f"%.{int(max_decimals)}f"
+    # Hashing-trick vectors hold only a handful of distinct values (k / norm), so format each once.
+    memo = {v: fmt % float(v) for v in set(vec)}
+    if 0.0 in memo:
+        # -0.0 == 0.0 as a dict key; always render zero unsigned (pgvector parses both the same).
+        memo[0.0] = fmt % 0.0
+    return "[" + ",".join(map(memo.__getitem__, vec)) + "]"
+
 
+def vector_literals(vecs: Any, *, max_decimals: int = 6) -> list[str]:
+    """
+    `vector_literal` for every row of an (n, dim) matrix.
 
+    Hashing-trick rows are sparse, so each literal is assembled from pre-built runs of
+    "0.000000," between the non-zero cells instead of formatting and joining all dim values.
+    """
+    if np is None:
+        return [vector_literal(v, max_decimals=max_decimals) for v in vecs]
+    mat = np.asarray(vecs, dtype=np.float64)
+    if mat.ndim != 2 or mat.shape[1] == 0:
+        return [vector_literal(list(v), max_decimals=max_decimals) for v in vecs]
+
+    n, dim = mat.shape
+    fmt = f"%.{int(max_decimals)}f"
+    zero_runs = np.array([(fmt % 0.0 + ",") * g for g in range(dim + 1)], dtype=object)
+
+    rows, cols = np.nonzero(mat)
+    uniq, inverse = np.unique(mat[rows, cols], return_inverse=True)
+    cells = np.array([fmt % v + "," for v in uniq.tolist()], dtype=object)[inverse]
+
+    # Non-zero cells of row r are rows/cols[bounds[r]:bounds[r + 1]] (np.nonzero is row-major).
+    bounds = np.searchsorted(rows, np.arange(n + 1))
+    starts, stops = bounds[:-1], bounds[1:]
+    prev_col = np.empty_like(cols)
+    prev_col[1:] = cols[:-1]
+    prev_col[starts[starts < stops]] = -1
+    last_col = np.full(n, -1, dtype=cols.dtype)
+    last_col[starts < stops] = cols[stops[starts < stops] - 1]
+
+    # Row r owns pieces[2*starts[r] + r : 2*stops[r] + r + 1]: (zero run, cell) per non-zero, then a trailing run.
+    pieces = np.empty(2 * len(cols) + n, dtype=object)
+    cell_pos = 2 * np.arange(len(cols)) + rows
+    pieces[cell_pos] = zero_runs[cols - prev_col - 1]
+    pieces[cell_pos + 1] = cells
+    row_ids = np.arange(n)
+    piece_starts = 2 * starts + row_ids
+    piece_ends = 2 * stops + row_ids
+    pieces[piece_ends] = zero_runs[dim - last_col - 1]
+
+    flat = pieces.tolist()
+    # Every piece ends with ",", so drop the last one.
+    return ["[" + "".join(flat[a : b + 1])[:-1] + "]" for a, b in zip(piece_starts.tolist(), piece_ends.tolist())]
+
+
+@lru_cache(maxsize=16)
 def ensure_sslmode_require(db_url: str) -> str:
     """
     Railway external Postgres often requires TLS. If sslmode is not set, default to require.
@@ -70,6 +184,7 @@ def ensure_sslmode_require(db_url: str) -> str:
     return url
 
 
+@lru_cache(maxsize=16)
 def mask_db_url(db_url: str) -> str:
     url = (db_url or "").strip()
     if not url:
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import itertools
 import json
+import operator
 import os
 import sys
-from dataclasses import dataclass
-from typing import Any, Iterable, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import Any, Iterable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
 
-from kb_pgvector import ensure_sslmode_require, hash_embedding, mask_db_url, vector_literal
-from ingredient_parser import clean_noise as parser_clean_noise
-from ingredient_parser import _preprocess as parser_preprocess
+from kb_pgvector import embedding_literals, ensure_sslmode_require, mask_db_url
+from ingredient_parser import _clean_and_preprocess as parser_clean_and_preprocess
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except Exception:  # noqa: BLE001
+    orjson = None  # type: ignore[assignment]
 
 
 try:
@@ -29,9 +39,24 @@ DEFAULT_SCHEMA = "pci_kb"
 DEFAULT_TABLE = "sku_ingredients"
 DEFAULT_DIM = 384
 DEFAULT_DB_URL_ENV = "PCI_KB_DATABASE_URL"
+# Storage type for the embedding column. halfvec (pgvector >= 0.7.0) stores float16: half the table,
+# index and wire size; float16's ~3 significant digits are plenty to rank hash embeddings by cosine.
+VECTOR_TYPES = ("vector", "halfvec")
+DEFAULT_VECTOR_TYPE = "vector"
+
+_EMBED_BATCH_ROWS = 4096
+_MAX_BIND_PARAMS = 65535
+# Below this many rows, process startup costs more than cleaning + embedding serially.
+_PARALLEL_MIN_ROWS = 5000
+# pgvector gained HNSW in 0.5.0; m/ef_construction are its build parameters (recall vs build time).
+_HNSW_MIN_VERSION = (0, 5, 0)
+_HNSW_M = 16
+_HNSW_EF_CONSTRUCTION = 64
 
 
 def _coerce_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value.strip()
     if value is None:
         return ""
     try:
@@ -42,18 +67,28 @@ def _coerce_text(value: Any) -> str:
     return str(value).strip()
 
 
-def _pick_first_nonempty(row: pd.Series, cols: list[str]) -> str:
-    for c in cols:
-        if c in row.index:
-            v = _coerce_text(row.get(c))
-            if v:
-                return v
-    return ""
+def _coerce_column(values: pd.Series) -> list[str]:
+    """Column-wise `_coerce_text`: missing -> "", everything else str()-ed and stripped."""
+    return values.where(values.notna(), "").astype(str).str.strip().tolist()
+
+
+def _pick_first_nonempty(columns: list[list[str]], n_rows: int) -> list[str]:
+    """Per row, the first non-empty value across already-coerced candidate columns (in priority order)."""
+    if not columns:
+        return [""] * n_rows
+    if len(columns) == 1:
+        return columns[0]
+    # Fold from the lowest-priority column up: each higher column wins wherever it is non-empty, so the
+    # per-row choice is one vectorized select per candidate column instead of a Python scan per row.
+    out = np.array(columns[-1], dtype=object)
+    for values in reversed(columns[:-1]):
+        arr = np.array(values, dtype=object)
+        out = np.where(arr != "", arr, out)
+    return out.tolist()
 
 
 def clean_raw_ingredient_text(raw: str) -> str:
-    pre = parser_preprocess(raw or "")
-    cleaned, _notes = parser_clean_noise(pre)
+    cleaned, _notes = parser_clean_and_preprocess(raw or "")
     return cleaned
 
 
@@ -75,11 +110,44 @@ def build_kb_text(*, brand: str, product_name: str, market: str, category: str,
 
 
 def _json_or_none(value: Any) -> Any:
-    if value is None:
+    if isinstance(value, str):
+        s = value.strip()
+    else:
+        if value is None:
+            return None
+        try:
+            if pd.isna(value):
+                return None
+        except Exception:  # noqa: BLE001
+            pass
+        if isinstance(value, (dict, list)):
+            return value
+        s = str(value).strip()
+    if not s:
+        return None
+    # Some CSV exports wrap JSON arrays as strings.
+    try:
+        return json.loads(s)
+    except Exception:  # noqa: BLE001
         return None
 
 
+def _dump_json(value: Any) -> str:
+    # jsonb re-normalizes whitespace and key order, so orjson's compact output stores the same value.
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False)
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
+
+
 def _coerce_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUTHY
     if value is None:
         return False
     if isinstance(value, bool):
@@ -90,25 +158,10 @@ def _coerce_bool(value: Any) -> bool:
     except Exception:  # noqa: BLE001
         pass
     raw = str(value).strip().lower()
-    return raw in {"1", "true", "yes", "y", "on"}
-    try:
-        if pd.isna(value):
-            return None
-    except Exception:  # noqa: BLE001
-        pass
-    if isinstance(value, (dict, list)):
-        return value
-    s = str(value).strip()
-    if not s:
-        return None
-    # Some CSV exports wrap JSON arrays as strings.
-    try:
-        return json.loads(s)
-    except Exception:  # noqa: BLE001
-        return None
+    return raw in _TRUTHY
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KbRow:
     sku_key: str
     market: str
@@ -130,6 +183,85 @@ class KbRow:
     embedding_literal: str
 
 
+# KbRow's fields in declaration order, i.e. the upsert's column order, fetched in one C call.
+_KB_ROW_VALUES = operator.attrgetter(*(f.name for f in fields(KbRow)))
+_INCI_JSON_POS = [f.name for f in fields(KbRow)].index("inci_list_json")
+# Table columns upsert_rows writes per row, in the order of its value tuples (KbRow fields, then content_sha).
+_UPSERT_COLUMNS = [f.name for f in fields(KbRow) if f.name != "embedding_literal"] + ["embedding", "content_sha"]
+
+
+_SKU_KEY_COLS = ["candidate_id", "sku_key", "row_id", "id"]
+_BRAND_COLS = ["brand_en", "brand_original", "brand", "brand_zh"]
+_PRODUCT_NAME_COLS = ["product_name_en", "product_name_original", "product_name", "product", "product_name_zh"]
+_SOURCE_REF_COLS = ["source_ref", "source_url", "url"]
+_HARVEST_STATUS_COLS = ["harvest_status", "status"]
+# Every CSV column build_rows reads; read_ingest_csv skips the rest.
+_INGEST_COLUMNS = frozenset(
+    _SKU_KEY_COLS
+    + _BRAND_COLS
+    + _PRODUCT_NAME_COLS
+    + _SOURCE_REF_COLS
+    + _HARVEST_STATUS_COLS
+    + [
+        "market",
+        "category",
+        "source_type",
+        "parse_status",
+        "review_status",
+        "audit_status",
+        "raw_ingredient_text",
+        "inci_list",
+        "inci_list_json",
+        "ingest_allowed",
+        "harvest_confidence",
+        "parse_confidence",
+    ]
+)
+
+
+def read_ingest_csv(path: str) -> pd.DataFrame:
+    """
+    Load only the columns build_rows reads.
+
+    Everything but the sku_key columns is read as str, skipping per-column type inference; empty cells are
+    still NaN. The sku_key columns keep pandas' default whole-file inference so stored keys stay as they were
+    (e.g. row_id 7 in a column with blanks is still "7.0"). Uses pandas' multithreaded pyarrow reader when
+    pyarrow is installed.
+    """
+    try:
+        import pyarrow  # type: ignore[import-not-found]  # noqa: F401
+
+        engine = "pyarrow"
+    except Exception:  # noqa: BLE001
+        engine = "c"
+    usecols = _ingest_usecols(path)
+    return pd.read_csv(path, usecols=usecols, dtype=_ingest_dtypes(path, usecols), engine=engine)
+
+
+def iter_ingest_csv(path: str, *, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """`read_ingest_csv` in frames of at most chunk_rows rows (C reader: pandas' pyarrow engine cannot stream)."""
+    usecols = _ingest_usecols(path)
+    with pd.read_csv(path, usecols=usecols, dtype=_ingest_dtypes(path, usecols), chunksize=chunk_rows) as reader:
+        yield from reader
+
+
+def _ingest_usecols(path: str) -> list[str]:
+    header = pd.read_csv(path, nrows=0).columns
+    return [c for c in header if c in _INGEST_COLUMNS]
+
+
+def _ingest_dtypes(path: str, usecols: list[str]) -> dict[str, Any]:
+    # Infer the sku_key columns over the whole file in one narrow pass, so every chunk (and the pyarrow
+    # reader) spells keys exactly as a plain pd.read_csv of the file would; inferred-text columns stay str.
+    key_cols = [c for c in usecols if c in _SKU_KEY_COLS]
+    key_dtypes = pd.read_csv(path, usecols=key_cols).dtypes if key_cols else pd.Series(dtype=object)
+    dtypes: dict[str, Any] = {c: str for c in usecols}
+    for col, dtype in key_dtypes.items():
+        if dtype != object:
+            dtypes[col] = dtype
+    return dtypes
+
+
 def build_rows(
     df: pd.DataFrame,
     *,
@@ -138,53 +270,140 @@ def build_rows(
     only_review_status: str = "",
     only_audit_status: str = "",
     require_ingest_allowed: bool = False,
+    workers: int = 1,
+    pool: Optional[Executor] = None,
 ) -> list[KbRow]:
-    out: list[KbRow] = []
-    for _idx, row in df.iterrows():
-        sku_key = _pick_first_nonempty(row, ["candidate_id", "sku_key", "row_id", "id"])
-        if not sku_key:
-            continue
+    """
+    Turn harvested+parsed CSV rows into KbRows (gated, cleaned, embedded).
+
+    `workers` > 1 (0 = CPU count) shards frames above `_PARALLEL_MIN_ROWS` rows across processes;
+    rows carry no cross-row state, so results are concatenated in input order. Pass `pool` to reuse one
+    executor across calls (e.g. per streamed chunk) instead of starting a new one each time.
+    """
+    kwargs = dict(
+        dim=dim,
+        only_parse_status=only_parse_status,
+        only_review_status=only_review_status,
+        only_audit_status=only_audit_status,
+        require_ingest_allowed=require_ingest_allowed,
+    )
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    if workers <= 1 or len(df) <= _PARALLEL_MIN_ROWS:
+        return _build_rows_serial(df, **kwargs)  # type: ignore[arg-type]
 
-        market = _pick_first_nonempty(row, ["market"])
-        category = _pick_first_nonempty(row, ["category"])
+    shard_rows = -(-len(df) // workers)
+    shards = [df.iloc[start : start + shard_rows] for start in range(0, len(df), shard_rows)]
+    build = partial(_build_rows_serial, **kwargs)
+    if pool is not None:
+        return list(itertools.chain.from_iterable(pool.map(build, shards)))
+    with ProcessPoolExecutor(max_workers=workers) as own_pool:
+        return list(itertools.chain.from_iterable(own_pool.map(build, shards)))
 
-        brand = _pick_first_nonempty(row, ["brand_en", "brand_original", "brand", "brand_zh"])
-        product_name = _pick_first_nonempty(
-            row,
-            ["product_name_en", "product_name_original", "product_name", "product", "product_name_zh"],
-        )
 
-        source_ref = _pick_first_nonempty(row, ["source_ref", "source_url", "url"])
-        source_type = _pick_first_nonempty(row, ["source_type"])
-        harvest_status = _pick_first_nonempty(row, ["harvest_status", "status"])
+def _build_rows_serial(
+    df: pd.DataFrame,
+    *,
+    dim: int,
+    only_parse_status: str,
+    only_review_status: str,
+    only_audit_status: str,
+    require_ingest_allowed: bool,
+) -> list[KbRow]:
+    # Coerce each candidate column once, column-wise, instead of per-cell `pd.isna` + str() in the row loop.
+    col_pos: dict[str, int] = {}
+    for i, c in enumerate(df.columns):
+        col_pos.setdefault(c, i)
+    n_rows = len(df)
+
+    def text_field(cols: list[str]) -> list[str]:
+        return _pick_first_nonempty([_coerce_column(df.iloc[:, col_pos[c]]) for c in cols if c in col_pos], n_rows)
+
+    def raw_field(col: str, *, nan_to_none: bool = False) -> Optional[list[Any]]:
+        i = col_pos.get(col)
+        if i is None:
+            return None
+        values = df.iloc[:, i]
+        if nan_to_none:
+            values = values.astype(object).where(values.notna(), None)
+        return values.tolist()
+
+    sku_keys = text_field(_SKU_KEY_COLS)
+    markets = text_field(["market"])
+    categories = text_field(["category"])
+    brands = text_field(_BRAND_COLS)
+    product_names = text_field(_PRODUCT_NAME_COLS)
+    source_refs = text_field(_SOURCE_REF_COLS)
+    source_types = text_field(["source_type"])
+    harvest_statuses = text_field(_HARVEST_STATUS_COLS)
+    parse_statuses = text_field(["parse_status"])
+    review_statuses = text_field(["review_status"])
+    audit_statuses = text_field(["audit_status"])
+    raws = text_field(["raw_ingredient_text"])
+    inci_lists = text_field(["inci_list"])
+    # _coerce_bool column-wise: str() of True/False/1/"yes" etc., with missing cells coerced to "" (falsy).
+    ingest_alloweds = [v.lower() in _TRUTHY for v in text_field(["ingest_allowed"])]
+    harvest_confs = raw_field("harvest_confidence")
+    parse_confs = raw_field("parse_confidence")
+    inci_jsons = raw_field("inci_list_json", nan_to_none=True)
+
+    # Catalog variants share ingredient text; clean (and JSON-decode) each distinct text once.
+    clean_memo: dict[str, str] = {}
+    json_memo: dict[str, Any] = {}
+
+    kb_texts: list[str] = []
+    pending: list[tuple[Any, ...]] = []
+    for i in range(n_rows):
+        sku_key = sku_keys[i]
+        if not sku_key:
+            continue
 
-        parse_status = _pick_first_nonempty(row, ["parse_status"])
+        parse_status = parse_statuses[i]
         if only_parse_status and parse_status != only_parse_status:
             continue
-        review_status = _pick_first_nonempty(row, ["review_status"])
+        review_status = review_statuses[i]
         if only_review_status and review_status != only_review_status:
             continue
-        audit_status = _pick_first_nonempty(row, ["audit_status"])
+        audit_status = audit_statuses[i]
         if only_audit_status and audit_status != only_audit_status:
             continue
-        ingest_allowed = _coerce_bool(row.get("ingest_allowed")) if "ingest_allowed" in row.index else False
+        ingest_allowed = ingest_alloweds[i]
         if require_ingest_allowed and not ingest_allowed:
             continue
 
         try:
-            harvest_conf = float(row.get("harvest_confidence")) if "harvest_confidence" in row.index else None
+            harvest_conf = float(harvest_confs[i]) if harvest_confs is not None else None
         except Exception:  # noqa: BLE001
             harvest_conf = None
         try:
-            parse_conf = float(row.get("parse_confidence")) if "parse_confidence" in row.index else None
+            parse_conf = float(parse_confs[i]) if parse_confs is not None else None
         except Exception:  # noqa: BLE001
             parse_conf = None
 
-        raw = _pick_first_nonempty(row, ["raw_ingredient_text"])
-        raw_clean = clean_raw_ingredient_text(raw) if raw else ""
-
-        inci_list = _pick_first_nonempty(row, ["inci_list"])
-        inci_json = _json_or_none(row.get("inci_list_json")) if "inci_list_json" in row.index else None
+        raw = raws[i]
+        raw_clean = ""
+        if raw:
+            raw_clean = clean_memo.get(raw)  # type: ignore[assignment]
+            if raw_clean is None:
+                raw_clean = clean_memo[raw] = clean_raw_ingredient_text(raw)
+
+        inci_list = inci_lists[i]
+        raw_json = inci_jsons[i] if inci_jsons is not None else None
+        if raw_json is None:
+            inci_json = None
+        elif isinstance(raw_json, str):
+            if raw_json not in json_memo:
+                json_memo[raw_json] = _json_or_none(raw_json)
+            inci_json = json_memo[raw_json]
+        else:
+            inci_json = _json_or_none(raw_json)
+
+        market = markets[i]
+        category = categories[i]
+        brand = brands[i]
+        product_name = product_names[i]
+        source_ref = source_refs[i]
+        source_type = source_types[i]
+        harvest_status = harvest_statuses[i]
 
         if not (raw_clean or inci_list):
             # Skip rows without any usable ingredient signal.
@@ -198,32 +417,38 @@ def build_rows(
             inci_list=inci_list,
             raw_clean=raw_clean,
         )
-        emb = hash_embedding(kb_text, dim=dim)
-        emb_lit = vector_literal(emb)
-
-        out.append(
-            KbRow(
-                sku_key=sku_key,
-                market=market,
-                brand=brand,
-                product_name=product_name,
-                category=category,
-                source_ref=source_ref,
-                source_type=source_type,
-                harvest_status=harvest_status,
-                harvest_confidence=harvest_conf,
-                parse_status=parse_status,
-                parse_confidence=parse_conf,
-                review_status=review_status,
-                audit_status=audit_status,
-                ingest_allowed=ingest_allowed,
-                raw_ingredient_text_clean=raw_clean,
-                inci_list=inci_list,
-                inci_list_json=inci_json,
-                embedding_literal=emb_lit,
+        kb_texts.append(kb_text)
+        # Positional KbRow fields (all but embedding_literal): a tuple per row rather than a kwargs dict.
+        pending.append(
+            (
+                sku_key,
+                market,
+                brand,
+                product_name,
+                category,
+                source_ref,
+                source_type,
+                harvest_status,
+                harvest_conf,
+                parse_status,
+                parse_conf,
+                review_status,
+                audit_status,
+                ingest_allowed,
+                raw_clean,
+                inci_list,
+                inci_json,
             )
         )
-    return out
+
+    # Re-crawled SKUs repeat the same kb_text; embed each distinct text once, in fixed-size batches
+    # (one scatter-add per batch, bounded (batch x dim) scratch memory).
+    unique_texts = list(dict.fromkeys(kb_texts))
+    literal_by_text: dict[str, str] = {}
+    for start in range(0, len(unique_texts), _EMBED_BATCH_ROWS):
+        batch = unique_texts[start : start + _EMBED_BATCH_ROWS]
+        literal_by_text.update(zip(batch, embedding_literals(batch, dim=dim)))
+    return [KbRow(*row_fields, literal_by_text[text]) for row_fields, text in zip(pending, kb_texts)]
 
 
 def _connect(db_url: str):
@@ -246,9 +471,19 @@ def resolve_db_url(explicit: str = "") -> str:
 
 def _exec_many(conn, sql: str, rows: list[tuple[Any, ...]], *, template: str, page_size: int) -> None:
     if _DB_DRIVER == "psycopg" and psycopg is not None:
+        # psycopg3 has no execute_values; emulate it with one multi-row VALUES statement per page
+        # instead of executemany's statement per row. Postgres caps a statement at 65535 parameters.
+        per_row = template.count("%s")
+        page = max(1, min(int(page_size), _MAX_BIND_PARAMS // max(1, per_row)))
+        # Every full page has the same statement text: build it once per page length rather than once per page.
+        statements: dict[int, str] = {}
         with conn.cursor() as cur:
-            # psycopg3 has executemany but no execute_values; fall back to executemany.
-            cur.executemany(sql.replace("VALUES %s", f"VALUES {template}"), rows)
+            for start in range(0, len(rows), page):
+                chunk = rows[start : start + page]
+                stmt = statements.get(len(chunk))
+                if stmt is None:
+                    stmt = statements[len(chunk)] = sql.replace("VALUES %s", "VALUES " + ",".join([template] * len(chunk)))
+                cur.execute(stmt, list(itertools.chain.from_iterable(chunk)))
         conn.commit()
         return
 
@@ -257,7 +492,17 @@ def _exec_many(conn, sql: str, rows: list[tuple[Any, ...]], *, template: str, pa
     conn.commit()
 
 
-def init_schema(conn, *, schema: str, table: str, dim: int, create_index: bool) -> None:
+def init_schema(
+    conn,
+    *,
+    schema: str,
+    table: str,
+    dim: int,
+    create_index: bool,
+    vector_type: str = DEFAULT_VECTOR_TYPE,
+) -> None:
+    if vector_type not in VECTOR_TYPES:
+        raise ValueError(f"vector_type must be one of {VECTOR_TYPES}, got {vector_type!r}")
     qualified = f"{schema}.{table}"
 
     ddl = [
@@ -282,7 +527,8 @@ CREATE TABLE IF NOT EXISTS {qualified} (
   raw_ingredient_text_clean TEXT,
   inci_list TEXT,
   inci_list_json JSONB,
-  embedding vector({int(dim)}),
+  embedding {vector_type}({int(dim)}),
+  content_sha BYTEA,
   created_at TIMESTAMPTZ DEFAULT now(),
   updated_at TIMESTAMPTZ DEFAULT now()
 );
@@ -290,6 +536,7 @@ CREATE TABLE IF NOT EXISTS {qualified} (
         f"ALTER TABLE {qualified} ADD COLUMN IF NOT EXISTS audit_status TEXT;",
         f"ALTER TABLE {qualified} ADD COLUMN IF NOT EXISTS ingest_allowed BOOLEAN DEFAULT FALSE;",
         f"ALTER TABLE {qualified} ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ DEFAULT now();",
+        f"ALTER TABLE {qualified} ADD COLUMN IF NOT EXISTS content_sha BYTEA;",
         f"CREATE INDEX IF NOT EXISTS {table}_market_idx ON {qualified} (market);",
         f"CREATE INDEX IF NOT EXISTS {table}_parse_status_idx ON {qualified} (parse_status);",
         f"CREATE INDEX IF NOT EXISTS {table}_review_status_idx ON {qualified} (review_status);",
@@ -297,42 +544,68 @@ CREATE TABLE IF NOT EXISTS {qualified} (
         f"CREATE INDEX IF NOT EXISTS {table}_ingest_allowed_idx ON {qualified} (ingest_allowed);",
     ]
 
-    if _DB_DRIVER == "psycopg" and psycopg is not None:
-        with conn.cursor() as cur:
-            for s in ddl:
-                cur.execute(s)
-        conn.commit()
-    else:
-        with conn.cursor() as cur:
-            for s in ddl:
-                cur.execute(s)
-        conn.commit()
+    # One round trip: without bind parameters both drivers send the statements as a single simple query,
+    # which Postgres runs in one implicit transaction.
+    with conn.cursor() as cur:
+        cur.execute("\n".join(s.strip() for s in ddl))
+    conn.commit()
 
     if not create_index:
         return
 
-    # Best-effort: HNSW if supported, else IVFFLAT. Either may fail depending on pgvector version.
+    # HNSW when the installed pgvector has it, else IVFFLAT. Report what was built: a silently missing
+    # vector index turns every query into a sequential scan.
+    version = _pgvector_version(conn)
     index_sqls = [
-        f"CREATE INDEX IF NOT EXISTS {table}_embedding_hnsw ON {qualified} USING hnsw (embedding vector_cosine_ops);",
-        f"CREATE INDEX IF NOT EXISTS {table}_embedding_ivfflat ON {qualified} USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);",
+        (
+            "ivfflat",
+            f"CREATE INDEX IF NOT EXISTS {table}_embedding_ivfflat ON {qualified} USING ivfflat (embedding {vector_type}_cosine_ops) WITH (lists = 100);",
+        ),
     ]
+    if version is None or version >= _HNSW_MIN_VERSION:
+        index_sqls.insert(
+            0,
+            (
+                "hnsw",
+                f"CREATE INDEX IF NOT EXISTS {table}_embedding_hnsw ON {qualified} USING hnsw (embedding {vector_type}_cosine_ops) "
+                f"WITH (m = {_HNSW_M}, ef_construction = {_HNSW_EF_CONSTRUCTION});",
+            ),
+        )
 
-    for s in index_sqls:
+    version_label = ".".join(map(str, version)) if version else "unknown"
+    for kind, s in index_sqls:
         try:
-            if _DB_DRIVER == "psycopg" and psycopg is not None:
-                with conn.cursor() as cur:
-                    cur.execute(s)
-                conn.commit()
-            else:
-                with conn.cursor() as cur:
-                    cur.execute(s)
-                conn.commit()
-            break
-        except Exception:  # noqa: BLE001
+            with conn.cursor() as cur:
+                cur.execute(s)
+            conn.commit()
+        except Exception as exc:  # noqa: BLE001
+            print(f"[kb] {kind} index on {qualified} failed (pgvector {version_label}): {exc}", file=sys.stderr)
             try:
                 conn.rollback()
             except Exception:  # noqa: BLE001
                 pass
+            continue
+        print(f"[kb] vector index on {qualified}: {kind} (pgvector {version_label})", file=sys.stderr)
+        return
+    print(f"[kb] WARNING: no vector index on {qualified}; queries will scan the whole table", file=sys.stderr)
+
+
+def _pgvector_version(conn) -> Optional[tuple[int, ...]]:
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector';")
+            row = cur.fetchone()
+        conn.commit()
+    except Exception:  # noqa: BLE001
+        try:
+            conn.rollback()
+        except Exception:  # noqa: BLE001
+            pass
+        return None
+    if not row or not row[0]:
+        return None
+    parts = [p for p in str(row[0]).split(".") if p.isdigit()]
+    return tuple(int(p) for p in parts) or None
 
 
 def upsert_rows(
@@ -342,9 +615,28 @@ def upsert_rows(
     schema: str,
     table: str,
     batch_size: int,
-) -> None:
+    vector_type: str = DEFAULT_VECTOR_TYPE,
+    skip_unchanged: bool = True,
+    use_copy: bool = False,
+) -> int:
+    """
+    Upsert rows and return how many were sent.
+
+    Each row carries content_sha, a digest of every value it writes. With skip_unchanged, rows whose
+    digest matches the stored one are dropped before upload, and ON CONFLICT leaves matching rows (and
+    their updated_at) untouched, so re-ingesting an unchanged CSV writes nothing.
+
+    With use_copy (psycopg3 only), rows are streamed with COPY into a temporary staging table and merged
+    with one INSERT ... SELECT, instead of being sent as bound VALUES pages.
+    """
+    if vector_type not in VECTOR_TYPES:
+        raise ValueError(f"vector_type must be one of {VECTOR_TYPES}, got {vector_type!r}")
+    # A multi-row upsert can't update the same key twice; keep the last row per sku_key, which is
+    # what row-at-a-time upserts ended up with.
+    rows = list({r.sku_key: r for r in rows}.values())
     qualified = f"{schema}.{table}"
-    sql = f"""
+    only_if_changed = f"WHERE {qualified}.content_sha IS DISTINCT FROM EXCLUDED.content_sha" if skip_unchanged else ""
+    insert_head = f"""
 INSERT INTO {qualified} (
   sku_key,
   market,
@@ -364,10 +656,12 @@ INSERT INTO {qualified} (
   inci_list,
   inci_list_json,
   embedding,
+  content_sha,
   created_at,
   updated_at
 )
-VALUES %s
+"""
+    on_conflict = f"""
 ON CONFLICT (sku_key) DO UPDATE SET
   market = EXCLUDED.market,
   brand = EXCLUDED.brand,
@@ -386,65 +680,67 @@ ON CONFLICT (sku_key) DO UPDATE SET
   inci_list = EXCLUDED.inci_list,
   inci_list_json = EXCLUDED.inci_list_json,
   embedding = EXCLUDED.embedding,
-  updated_at = now();
+  content_sha = EXCLUDED.content_sha,
+  updated_at = now()
+{only_if_changed};
 """
+    sql = insert_head + "VALUES %s" + on_conflict
     if _DB_DRIVER == "psycopg" and psycopg is not None:
-        values: list[tuple[Any, ...]] = []
-        for r in rows:
-            values.append(
-                (
-                    r.sku_key,
-                    r.market,
-                    r.brand,
-                    r.product_name,
-                    r.category,
-                    r.source_ref,
-                    r.source_type,
-                    r.harvest_status,
-                    r.harvest_confidence,
-                    r.parse_status,
-                    r.parse_confidence,
-                    r.review_status,
-                    r.audit_status,
-                    r.ingest_allowed,
-                    r.raw_ingredient_text_clean,
-                    r.inci_list,
-                    json.dumps(r.inci_list_json, ensure_ascii=False) if r.inci_list_json is not None else None,
-                    r.embedding_literal,
-                )
+        # psycopg3: inline template with ::vector (or ::halfvec) casts
+        encode_json: Any = _dump_json
+        template = f"(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s::{vector_type},%s, now(), now())"
+    else:
+        encode_json = psycopg2.extras.Json
+        template = f"(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::{vector_type},%s, now(), now())"
+
+    values: list[tuple[Any, ...]] = []
+    for row_values in map(_KB_ROW_VALUES, rows):
+        content_sha = hashlib.blake2b(repr(row_values).encode("utf-8"), digest_size=16).digest()
+        inci_json = row_values[_INCI_JSON_POS]
+        if inci_json is not None:
+            row_values = (
+                *row_values[:_INCI_JSON_POS],
+                encode_json(inci_json),
+                *row_values[_INCI_JSON_POS + 1 :],
             )
-        # psycopg3: inline template with ::vector casts
-        template = "(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s::vector, now(), now())"
+        values.append((*row_values, content_sha))
+
+    if skip_unchanged and values:
+        stored = _stored_content_shas(conn, qualified, [v[0] for v in values])
+        values = [v for v in values if stored.get(v[0]) != v[-1]]
+        if not values:
+            conn.commit()
+            return 0
+    if use_copy and _DB_DRIVER == "psycopg" and psycopg is not None:
+        _copy_merge(conn, values, qualified=qualified, table=table, insert_head=insert_head, on_conflict=on_conflict)
+    else:
         _exec_many(conn, sql, values, template=template, page_size=batch_size)
-        return
+    return len(values)
 
-    values2: list[tuple[Any, ...]] = []
-    for r in rows:
-        values2.append(
-            (
-                r.sku_key,
-                r.market,
-                r.brand,
-                r.product_name,
-                r.category,
-                r.source_ref,
-                r.source_type,
-                r.harvest_status,
-                r.harvest_confidence,
-                r.parse_status,
-                r.parse_confidence,
-                r.review_status,
-                r.audit_status,
-                r.ingest_allowed,
-                r.raw_ingredient_text_clean,
-                r.inci_list,
-                psycopg2.extras.Json(r.inci_list_json) if r.inci_list_json is not None else None,
-                r.embedding_literal,
-            )
-        )
 
-    template2 = "(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::vector, now(), now())"
-    _exec_many(conn, sql, values2, template=template2, page_size=batch_size)
+def _copy_merge(conn, values: list[tuple[Any, ...]], *, qualified: str, table: str, insert_head: str, on_conflict: str) -> None:
+    # The staging table copies the target's column types, so COPY's text format parses the vector
+    # literal, JSON and bytea straight into them; ON COMMIT DELETE ROWS empties it for the next chunk.
+    stage = f"{table}_stage"
+    columns = ", ".join(_UPSERT_COLUMNS)
+    with conn.cursor() as cur:
+        cur.execute(f"CREATE TEMP TABLE IF NOT EXISTS {stage} (LIKE {qualified} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS;")
+        with cur.copy(f"COPY {stage} ({columns}) FROM STDIN") as copy:
+            for row in values:
+                copy.write_row(row)
+        # WHERE true keeps the parser from reading ON CONFLICT as a join condition of the FROM item.
+        cur.execute(insert_head + f"SELECT {columns}, now(), now() FROM {stage} WHERE true" + on_conflict)
+    conn.commit()
+
+
+def _stored_content_shas(conn, qualified: str, sku_keys: list[str]) -> dict[str, bytes]:
+    with conn.cursor() as cur:
+        cur.execute(
+            f"SELECT sku_key, content_sha FROM {qualified} WHERE sku_key = ANY(%s) AND content_sha IS NOT NULL;",
+            [sku_keys],
+        )
+        # psycopg2 returns bytea as memoryview.
+        return {key: bytes(sha) for key, sha in cur.fetchall()}
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -454,7 +750,25 @@ def main(argv: Optional[list[str]] = None) -> int:
     ap.add_argument("--schema", default=DEFAULT_SCHEMA)
     ap.add_argument("--table", default=DEFAULT_TABLE)
     ap.add_argument("--dim", type=int, default=DEFAULT_DIM)
+    ap.add_argument(
+        "--vector-type",
+        choices=VECTOR_TYPES,
+        default=DEFAULT_VECTOR_TYPE,
+        help="Embedding column type. 'halfvec' (pgvector >= 0.7.0) halves storage; must match the existing table.",
+    )
     ap.add_argument("--batch-size", type=int, default=200)
+    ap.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=100_000,
+        help="CSV rows to clean, embed and upsert at a time (default: 100000; 0 loads the whole file at once).",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=f"Processes for cleaning/embedding (default: 1; 0 = CPU count; chunks up to {_PARALLEL_MIN_ROWS} rows run serially).",
+    )
     ap.add_argument("--only-parse-status", default="", help="If set, only ingest rows with this parse_status (e.g. OK).")
     ap.add_argument("--only-review-status", default="", help="If set, only ingest rows with this review_status (e.g. APPROVED).")
     ap.add_argument("--only-audit-status", default="", help="If set, only ingest rows with this audit_status (e.g. PASS).")
@@ -462,6 +776,16 @@ def main(argv: Optional[list[str]] = None) -> int:
     ap.add_argument("--no-index", action="store_true", help="Skip creating vector index.")
     ap.add_argument("--init-only", action="store_true", help="Create/upgrade schema and exit without ingesting rows.")
     ap.add_argument("--dry-run", action="store_true", help="Do not write to DB; just print counts.")
+    ap.add_argument(
+        "--copy",
+        action="store_true",
+        help="psycopg3 only: load rows with COPY into a temp staging table, then merge with INSERT ... SELECT.",
+    )
+    ap.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite every row, even when its stored content_sha shows it is unchanged.",
+    )
     args = ap.parse_args(argv)
 
     db_url = resolve_db_url(args.db_url)
@@ -470,19 +794,71 @@ def main(argv: Optional[list[str]] = None) -> int:
         return 2
 
     csv_path = args.csv
-    df = pd.read_csv(csv_path)
-
-    rows = build_rows(
-        df,
-        dim=int(args.dim),
-        only_parse_status=str(args.only_parse_status or "").strip(),
-        only_review_status=str(args.only_review_status or "").strip(),
-        only_audit_status=str(args.only_audit_status or "").strip(),
-        require_ingest_allowed=bool(args.require_ingest_allowed),
-    )
+    chunk_rows = max(0, int(args.chunk_rows or 0))
+    # Stream the CSV: each chunk is cleaned, embedded and upserted before the next one is read, so peak
+    # memory is one chunk of rows rather than the whole file plus all of its KbRows.
+    chunks = iter_ingest_csv(csv_path, chunk_rows=chunk_rows) if chunk_rows else iter([read_ingest_csv(csv_path)])
+    # Read the first chunk before connecting, so a missing or malformed CSV fails before any DDL runs.
+    first = next(chunks, None)
+    chunks = itertools.chain([first], chunks) if first is not None else iter([])
+
+    def run_init_schema(conn) -> None:
+        init_schema(
+            conn,
+            schema=str(args.schema),
+            table=str(args.table),
+            dim=int(args.dim),
+            create_index=not bool(args.no_index),
+            vector_type=str(args.vector_type),
+        )
+
+    workers = int(args.workers) if int(args.workers) > 0 else (os.cpu_count() or 1)
+    # One process pool serves every chunk rather than being started and torn down per chunk.
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    conn = None
+    rows_total = rows_ingest = rows_written = 0
+    try:
+        if not args.dry_run and not args.init_only:
+            conn = _connect(db_url)
+            run_init_schema(conn)
+
+        for df in chunks:
+            rows = build_rows(
+                df,
+                dim=int(args.dim),
+                only_parse_status=str(args.only_parse_status or "").strip(),
+                only_review_status=str(args.only_review_status or "").strip(),
+                only_audit_status=str(args.only_audit_status or "").strip(),
+                require_ingest_allowed=bool(args.require_ingest_allowed),
+                workers=workers,
+                pool=pool,
+            )
+            rows_total += len(df)
+            rows_ingest += len(rows)
+            if conn is not None and rows:
+                # Upserts run in file order, so a sku_key repeated across chunks still ends with its last row.
+                rows_written += upsert_rows(
+                    conn,
+                    rows,
+                    schema=str(args.schema),
+                    table=str(args.table),
+                    batch_size=int(args.batch_size),
+                    vector_type=str(args.vector_type),
+                    skip_unchanged=not bool(args.force),
+                    use_copy=bool(args.copy),
+                )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:  # noqa: BLE001
+                pass
+
     print(
         (
-            f"rows_total={len(df)} rows_ingest={len(rows)} dim={int(args.dim)} "
+            f"rows_total={rows_total} rows_ingest={rows_ingest} rows_written={rows_written} dim={int(args.dim)} "
             f"parse_gate={str(args.only_parse_status or '').strip() or '-'} "
             f"review_gate={str(args.only_review_status or '').strip() or '-'} "
             f"audit_gate={str(args.only_audit_status or '').strip() or '-'} "
@@ -491,22 +867,21 @@ def main(argv: Optional[list[str]] = None) -> int:
         ),
         file=sys.stderr,
     )
-
     if args.dry_run:
         return 0
 
-    conn = _connect(db_url)
-    try:
-        init_schema(conn, schema=str(args.schema), table=str(args.table), dim=int(args.dim), create_index=not bool(args.no_index))
-        if args.init_only:
-            print("INIT_OK", file=sys.stderr)
-            return 0
-        upsert_rows(conn, rows, schema=str(args.schema), table=str(args.table), batch_size=int(args.batch_size))
-    finally:
+    if args.init_only:
+        # Counted like a dry run above; only the schema step touches the database.
+        conn = _connect(db_url)
         try:
-            conn.close()
-        except Exception:  # noqa: BLE001
-            pass
+            run_init_schema(conn)
+        finally:
+            try:
+                conn.close()
+            except Exception:  # noqa: BLE001
+                pass
+        print("INIT_OK", file=sys.stderr)
+        return 0
 
     print("OK", file=sys.stderr)
     return 0
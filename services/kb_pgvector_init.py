@@ -5,7 +5,17 @@ import sys
 from typing import Optional
 
 from kb_pgvector import ensure_sslmode_require, mask_db_url
-from kb_pgvector_ingest import DEFAULT_DB_URL_ENV, DEFAULT_DIM, DEFAULT_SCHEMA, DEFAULT_TABLE, _connect, init_schema, resolve_db_url
+from kb_pgvector_ingest import (
+    DEFAULT_DB_URL_ENV,
+    DEFAULT_DIM,
+    DEFAULT_SCHEMA,
+    DEFAULT_TABLE,
+    DEFAULT_VECTOR_TYPE,
+    VECTOR_TYPES,
+    _connect,
+    init_schema,
+    resolve_db_url,
+)
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -14,6 +24,12 @@ def main(argv: Optional[list[str]] = None) -> int:
     ap.add_argument("--schema", default=DEFAULT_SCHEMA)
     ap.add_argument("--table", default=DEFAULT_TABLE)
     ap.add_argument("--dim", type=int, default=DEFAULT_DIM)
+    ap.add_argument(
+        "--vector-type",
+        choices=VECTOR_TYPES,
+        default=DEFAULT_VECTOR_TYPE,
+        help="Embedding column type. 'halfvec' (pgvector >= 0.7.0) halves storage.",
+    )
     ap.add_argument("--no-index", action="store_true", help="Skip creating vector index.")
     args = ap.parse_args(argv)
 
@@ -30,13 +46,14 @@ def main(argv: Optional[list[str]] = None) -> int:
             table=str(args.table),
             dim=int(args.dim),
             create_index=not bool(args.no_index),
+            vector_type=str(args.vector_type),
         )
     finally:
         conn.close()
 
     print(
         (
-            f"INIT_OK schema={args.schema} table={args.table} dim={int(args.dim)} "
+            f"INIT_OK schema={args.schema} table={args.table} dim={int(args.dim)} vector_type={args.vector_type} "
             f"db={mask_db_url(ensure_sslmode_require(db_url))}"
         ),
         file=sys.stderr,
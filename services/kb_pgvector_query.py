@@ -45,6 +45,24 @@ def main(argv: Optional[list[str]] = None) -> int:
     ap.add_argument("--only-parse-status", default="OK")
     ap.add_argument("--limit", type=int, default=10)
     ap.add_argument("--text", required=True, help="Query text (brand/product/ingredients).")
+    ap.add_argument(
+        "--vector-type",
+        choices=["vector", "halfvec"],
+        default="vector",
+        help="Embedding column type the table was created with (see kb_pgvector_init --vector-type).",
+    )
+    ap.add_argument(
+        "--ef-search",
+        type=int,
+        default=80,
+        help="hnsw.ef_search for this query (higher = better recall, slower). 0 keeps the server default.",
+    )
+    ap.add_argument(
+        "--probes",
+        type=int,
+        default=10,
+        help="ivfflat.probes for this query, used when the table has an IVFFLAT index. 0 keeps the server default.",
+    )
     args = ap.parse_args(argv)
 
     db_url = resolve_db_url(args.db_url)
@@ -73,17 +91,27 @@ SELECT
   product_name,
   parse_status,
   review_status,
-  (embedding <=> %s::vector) AS distance
+  (embedding <=> %s::{args.vector_type}) AS distance
 FROM {qualified}
 {where_sql}
-ORDER BY embedding <=> %s::vector
+ORDER BY distance
 LIMIT {int(args.limit)};
 """
 
+    # The query vector is bound once: ORDER BY distance sorts on the same select-list expression, which
+    # pgvector's index scan still serves, instead of shipping the ~3 KB literal a second time.
     conn = _connect(db_url)
     try:
         with conn.cursor() as cur:
-            cur.execute(sql, [qvec, *params, qvec])
+            # Transaction-local index knobs. set_config takes bind parameters where SET cannot.
+            knobs = [("hnsw.ef_search", int(args.ef_search)), ("ivfflat.probes", int(args.probes))]
+            knobs = [(name, value) for name, value in knobs if value > 0]
+            if knobs:
+                cur.execute(
+                    "SELECT " + ", ".join(["set_config(%s, %s, true)"] * len(knobs)),
+                    [v for name, value in knobs for v in (name, str(value))],
+                )
+            cur.execute(sql, [qvec, *params])
             rows = cur.fetchall()
     finally:
         conn.close()